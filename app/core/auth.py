@@ -5,18 +5,32 @@
  * protecting API endpoints with role-based access control (RBAC).
  *
  * Public Functions:
- *    get_current_user(credentials: HTTPAuthorizationCredentials, db: Client) --> dict
+ *    load_users_cache(db: Client) --> None
+ *        Loads id, email and role of every user into the in-memory users cache
+ *    refresh_users_cache(db: Client) --> None
+ *        Background task that periodically reloads the users cache
+ *    load_jwks() --> None
+ *        Fetches the project's signing keys for local token verification
+ *    cache_user(user: dict) --> None / uncache_user(user_id: str) --> None
+ *        Keep the users cache in sync after user writes
+ *    purge_user(user_id: str) --> None
+ *        Drops a user and their verified tokens from this worker's caches
+ *    invalidate_user(user_id: str) --> None
+ *        Drops a user's cached tokens on every worker after a role change or delete
+ *    get_current_user(request: Request, credentials: HTTPAuthorizationCredentials,
+ *      db: Client) --> dict
  *        Gets the current authenticated user from JWT token
- *    get_optional_user(credentials: Optional[HTTPAuthorizationCredentials], db: Client) --> Optional[dict]
+ *    get_optional_user(request: Request, credentials: Optional[HTTPAuthorizationCredentials],
+ *      db: Client) --> Optional[dict]
  *        Gets current user if authenticated, otherwise returns None
  *    require_role(allowed_roles: List[UserRole]) --> Callable
  *        Factory function that returns a dependency requiring specific roles
  *    require_admin_dashboard_access(current_user: dict) --> dict
  *        Requires admin dashboard access (admin or policy working group)
- *    require_admin(current_user: dict) --> dict
- *        Requires admin role only - full access to create, edit, delete
- *    require_suggestion_manager(current_user: dict) --> dict
- *        Requires admin or policy working group - can manage suggestions
+ *    require_admin: Callable
+ *        Dependency requiring admin role only - full access to create, edit, delete
+ *    require_suggestion_manager: Callable
+ *        Dependency requiring admin or policy working group - can manage suggestions
  *    require_public_or_admin(current_user: Optional[dict]) --> Optional[dict]
  *        Allows both public and authenticated users
  *
@@ -24,28 +38,340 @@
  * @date: January 2026
 """
 
-from fastapi import Depends, HTTPException, status
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import time
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional, List, Callable
-from app.core.database import get_db, get_service_db
+from httpx import HTTPError
+from jose import jwt, JWTError
+from postgrest.exceptions import APIError
+from typing import Optional, List, Callable, Dict, Final, FrozenSet, Tuple, Union
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_db, get_http_client, get_service_db, run_query
+from app.core.redis_cache import cache_token_user, get_cached_token_user, invalidate_user_tokens
+from app.core.user_cache import forget_user
 from app.models.schemas import UserRole
 from supabase import Client
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
 
-# Roles that can access admin dashboard
-ADMIN_DASHBOARD_ROLES: List[str] = ["admin", "policy_working_group"]
+# Roles that can access admin dashboard (frozenset for O(1) membership checks)
+ADMIN_DASHBOARD_ROLES: Final[FrozenSet[str]] = frozenset({UserRole.ADMIN.value, UserRole.POLICY_WORKING_GROUP.value})
 
+# One bit per role, so role guards test membership with a single integer AND
+ROLE_BITS: Final[Dict[str, int]] = {role.value: 1 << i for i, role in enumerate(UserRole)}
+ADMIN_DASHBOARD_MASK: Final[int] = sum(ROLE_BITS[role] for role in ADMIN_DASHBOARD_ROLES)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Client = Depends(get_db)
-) -> dict:
+# Verified users keyed by sha256 of their access token (raw JWTs are never stored)
+TOKEN_CACHE_TTL: Final[int] = 60  # seconds
+_token_cache: Final[TTLCache] = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
+
+# Hashes of tokens that were rejected, so repeated bad tokens skip verification
+_rejected_token_cache: Final[TTLCache] = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
+
+# Generic 401 detail - backend error text is never echoed to the client
+INVALID_CREDENTIALS_DETAIL: Final[str] = "Could not validate credentials"
+
+# Verifications in progress keyed by token hash, so concurrent requests with
+# the same uncached token wait on one Supabase call instead of each making one
+_INFLIGHT: Final[Dict[str, asyncio.Future]] = {}
+
+# Project signing keys by key id, fetched from Supabase's JWKS endpoint so
+# asymmetrically signed tokens are verified without a network call
+JWKS_PATH: Final[str] = "/auth/v1/.well-known/jwks.json"
+JWKS_ALGORITHMS: Final[FrozenSet[str]] = frozenset({"RS256", "ES256"})
+JWKS_REFRESH_INTERVAL: Final[int] = 300  # seconds
+_jwks: Final[Dict[str, dict]] = {}
+_jwks_fetched_at: float = 0.0
+
+# Plausible size range of a Supabase access token, in characters
+JWT_MIN_LENGTH: Final[int] = 100
+JWT_MAX_LENGTH: Final[int] = 4096
+
+
+# Snapshot of the users table keyed by id, primed at startup and refreshed
+# periodically so role lookups during token verification are dict reads
+USERS_CACHE_REFRESH_INTERVAL: Final[int] = 60  # seconds
+USERS_BY_ID: Final[Dict[str, dict]] = {}
+
+# Rows requested per page when loading the snapshot (PostgREST's default max-rows)
+USERS_CACHE_PAGE_SIZE: Final[int] = 1000
+
+
+def load_users_cache(db: Client) -> None:
     """
-    Get current authenticated user from Supabase Auth token
+    Load id, email and role for every user into USERS_BY_ID
+    
+    The table is read in pages ordered by id until a page comes back empty, so
+    the snapshot is complete however many users there are - even if the
+    server's max-rows caps pages below USERS_CACHE_PAGE_SIZE.
     
     Args:
-        credentials: HTTP Bearer token credentials from request header
+        db: Supabase database client (service role)
+    """
+    users: Dict[str, dict] = {}
+    start: int = 0
+    while True:
+        response = (
+            db.table(settings.USERS_TABLE)
+            .select("id,email,role")
+            .order("id")
+            .range(start, start + USERS_CACHE_PAGE_SIZE - 1)
+            .execute()
+        )
+        rows: List[dict] = response.data or []
+        if not rows:
+            break
+        users.update((str(row["id"]), row) for row in rows)
+        start += len(rows)
+    
+    for user_id in USERS_BY_ID.keys() - users.keys():
+        USERS_BY_ID.pop(user_id, None)
+    USERS_BY_ID.update(users)
+
+
+async def refresh_users_cache(db: Client) -> None:
+    """
+    Reload USERS_BY_ID every USERS_CACHE_REFRESH_INTERVAL seconds
+    
+    Picks up role changes made by other workers. Intended to run as a
+    background task for the lifetime of the app.
+    
+    Args:
+        db: Supabase database client (service role)
+    """
+    while True:
+        await asyncio.sleep(USERS_CACHE_REFRESH_INTERVAL)
+        try:
+            await asyncio.to_thread(load_users_cache, db)
+        except Exception as e:
+            logger.warning("Could not refresh users cache: %s", e)
+
+
+def cache_user(user: dict) -> None:
+    """Add or update a user row in USERS_BY_ID after it is written"""
+    USERS_BY_ID[str(user["id"])] = {
+        "id": user["id"],
+        "email": user.get("email"),
+        "role": user.get("role", "public")
+    }
+
+
+def uncache_user(user_id: str) -> None:
+    """Remove a user from USERS_BY_ID after it is deleted"""
+    USERS_BY_ID.pop(str(user_id), None)
+
+
+def purge_user(user_id: str) -> None:
+    """Remove a user and every token verified for them from this worker's caches"""
+    user_id = str(user_id)
+    uncache_user(user_id)
+    forget_user(user_id)
+    _token_cache.discard_where(lambda user: str(user["id"]) == user_id)
+
+
+async def invalidate_user(user_id: str) -> None:
+    """
+    Invalidate a user's verified tokens on every worker
+    
+    Call after changing a user's role or deleting them, so stale roles are not
+    served from the token caches.
+    
+    Args:
+        user_id: ID of the changed user
+    """
+    purge_user(user_id)
+    await invalidate_user_tokens(user_id)
+
+
+def _credentials_exception() -> HTTPException:
+    """Build the 401 raised for any rejected token"""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=INVALID_CREDENTIALS_DETAIL,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _looks_like_jwt(token: str) -> bool:
+    """Cheap shape check - a JWT has exactly three dot-separated segments"""
+    return JWT_MIN_LENGTH <= len(token) <= JWT_MAX_LENGTH and token.count(".") == 2
+
+
+def _token_cache_key(token: str) -> str:
+    """Hash an access token for use as a cache key"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _token_lifetime(token: str) -> float:
+    """
+    Get the remaining lifetime of a JWT in seconds from its "exp" claim
+
+    The signature is not checked here - this is only used to bound how long a
+    token that was already verified by Supabase may be served from cache.
+    Returns 0 if the token cannot be parsed, so it is never cached.
+    """
+    try:
+        payload: str = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) - time.time()
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return 0.0
+
+
+async def load_jwks() -> None:
+    """
+    Fetch the project's JSON Web Key Set into _jwks
+    
+    Supabase signs access tokens with these asymmetric keys (RS256/ES256);
+    projects still on a shared secret publish an empty set.
+    """
+    global _jwks_fetched_at
+    response = await get_http_client().get(settings.SUPABASE_URL.rstrip("/") + JWKS_PATH)
+    response.raise_for_status()
+    keys: Dict[str, dict] = {key["kid"]: key for key in response.json().get("keys", []) if "kid" in key}
+    
+    for kid in _jwks.keys() - keys.keys():
+        _jwks.pop(kid, None)
+    _jwks.update(keys)
+    _jwks_fetched_at = time.monotonic()
+
+
+async def _local_verification_key(token: str) -> Optional[Tuple[Union[str, dict], str]]:
+    """
+    Pick the key that verifies a token locally, based on its header
+    
+    An unknown key id triggers a JWKS refetch (at most every
+    JWKS_REFRESH_INTERVAL seconds) to pick up rotated keys.
+    
+    Args:
+        token: Raw bearer token
+        
+    Returns:
+        Optional[Tuple[Union[str, dict], str]]: (key, algorithm), or None if the
+        token can only be verified by Supabase
+        
+    Raises:
+        JWTError: If the token header cannot be parsed
+    """
+    header: dict = jwt.get_unverified_header(token)
+    algorithm: str = header.get("alg", "")
+    
+    if algorithm == settings.JWT_ALGORITHM and settings.JWT_SECRET:
+        return settings.JWT_SECRET, algorithm
+    if algorithm not in JWKS_ALGORITHMS:
+        return None
+    
+    kid: Optional[str] = header.get("kid")
+    if kid not in _jwks and time.monotonic() - _jwks_fetched_at > JWKS_REFRESH_INTERVAL:
+        try:
+            await load_jwks()
+        except Exception as e:
+            logger.warning("Could not refresh JWKS: %s", e)
+    key: Optional[dict] = _jwks.get(kid)
+    return (key, algorithm) if key else None
+
+
+async def _verify_token_locally(token: str, key: Union[str, dict], algorithm: str, db: Client) -> dict:
+    """
+    Verify the JWT signature locally, then look up the role
+    
+    No call to Supabase Auth is made for known users; the claims in the signed
+    token are trusted until the token expires. A token whose user has no users
+    row is checked with Supabase instead, since its Auth account may have been
+    deleted after the token was issued.
+    
+    Args:
+        token: Raw bearer token
+        key: JWT secret or JSON Web Key that signed the token
+        algorithm: Signing algorithm from the token header
+        db: Supabase database client
+        
+    Returns:
+        dict: User id, email, role, metadata and whether a users row exists
+    """
+    claims: dict = jwt.decode(
+        token,
+        key,
+        algorithms=[algorithm],
+        audience="authenticated"
+    )
+    
+    # Role comes from the users snapshot; only unknown users hit the database
+    profile: Optional[dict] = USERS_BY_ID.get(claims["sub"])
+    if profile is None:
+        user_data = await run_query(
+            db.table(settings.USERS_TABLE).select("id,email,role").eq("id", claims["sub"]).limit(1)
+        )
+        if not user_data.data:
+            # Deleted users keep valid tokens until expiry; only an existing
+            # Auth account may get a users row created for it
+            return await _verify_token_online(token, db)
+        profile = user_data.data[0]
+        cache_user(profile)
+    
+    return {
+        "id": claims["sub"],
+        "email": claims.get("email"),
+        "role": profile.get("role") or "public",
+        "user_metadata": claims.get("user_metadata") or {},
+        "has_profile": True
+    }
+
+
+async def _verify_token_online(token: str, db: Client) -> dict:
+    """
+    Verify the token with Supabase and fetch the user's role in a single round-trip
+    
+    The RPC runs with the caller's JWT so auth.uid() resolves server-side.
+    
+    Args:
+        token: Raw bearer token
+        db: Supabase database client
+        
+    Returns:
+        dict: User id, email, role, metadata and whether a users row exists
+        
+    Raises:
+        HTTPException: 401 if the token does not resolve to a user
+    """
+    rpc = db.rpc("get_user_with_role", {})
+    rpc.headers["Authorization"] = f"Bearer {token}"
+    user_response = await run_query(rpc)
+    
+    if not user_response.data:
+        raise _credentials_exception()
+    
+    return user_response.data[0]
+
+
+def _copy_user(user: dict) -> dict:
+    """Copy a cached verified user (and its metadata) for one request"""
+    return {**user, "user_metadata": dict(user.get("user_metadata") or {})}
+
+
+async def _verify_token(token: str, db: Client) -> dict:
+    """
+    Verify an access token and resolve the user's role
+    
+    Tokens are verified locally when their signing key is known (JWKS or
+    JWT_SECRET), otherwise through Supabase. Verified users are cached by token hash for up to
+    TOKEN_CACHE_TTL seconds (never beyond the token's expiry), in process
+    and - when REDIS_URL is set - in Redis, shared by all workers.
+    Concurrent requests with the same uncached token share one verification.
+    Each caller gets its own copy of the user, so a route that changes it
+    cannot alter what later requests see.
+    
+    Args:
+        token: Raw bearer token
         db: Supabase database client
         
     Returns:
@@ -54,52 +380,152 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if token is invalid or user not found
     """
-    token: str = credentials.credentials
+    # Serve recently verified tokens from cache (skips the Supabase round-trip)
+    cache_key: str = _token_cache_key(token)
+    cached_user: Optional[dict] = _token_cache.get(cache_key)
+    if cached_user is not None:
+        return _copy_user(cached_user)
+    if _rejected_token_cache.get(cache_key):
+        raise _credentials_exception()
+    
+    # Join a verification of the same token that is already running
+    inflight: Optional[asyncio.Future] = _INFLIGHT.get(cache_key)
+    if inflight is not None:
+        try:
+            return _copy_user(await asyncio.shield(inflight))
+        except asyncio.CancelledError:
+            # Only our own cancellation propagates; if the first request was
+            # cancelled, verify the token here instead
+            if not inflight.cancelled():
+                raise
     
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[cache_key] = future
     try:
-        # Verify token with Supabase Auth
-        user_response = db.auth.get_user(token)
+        current_user: dict = await _verify_uncached_token(token, cache_key, db)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved so an unawaited future is not logged
+        raise
+    else:
+        future.set_result(current_user)
+        return _copy_user(current_user)
+    finally:
+        if _INFLIGHT.get(cache_key) is future:
+            del _INFLIGHT[cache_key]
+
+
+async def _verify_uncached_token(token: str, cache_key: str, db: Client) -> dict:
+    """
+    Verify a token that is not in the process cache (see _verify_token)
+    
+    Args:
+        token: Raw bearer token
+        cache_key: Hash of the token
+        db: Supabase database client
         
-        if not user_response or not user_response.user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    Returns:
+        dict: Dictionary containing user id, email, role, and metadata
         
-        user = user_response.user
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    # Another worker may already have verified this token
+    cached_user: Optional[dict] = await get_cached_token_user(cache_key)
+    if cached_user is not None:
+        _token_cache.set(cache_key, cached_user, ttl=_token_lifetime(token))
+        return cached_user
+    
+    try:
+        local_key = await _local_verification_key(token)
+        if local_key is not None:
+            user: dict = await _verify_token_locally(token, *local_key, db)
+        else:
+            user = await _verify_token_online(token, db)
         
-        # Get user role from users table
-        user_data = db.table("users").select("*").eq("id", user.id).execute()
+        role: str = user.get("role") or "public"
         
-        if user_data.data:
-            role: str = user_data.data[0].get("role", "public")
-        else:
+        if not user.get("has_profile"):
             # If user doesn't exist in users table, create with default role
             # Note: Users should be registered by admin, but if they somehow exist in Auth
             # but not in users table, default to public
-            role = "public"
-            db.table("users").insert({
-                "id": user.id,
-                "email": user.email,
+            await run_query(db.table(settings.USERS_TABLE).insert({
+                "id": user["id"],
+                "email": user["email"],
                 "role": role
-            }).execute()
+            }))
+            cache_user(user)
         
-        return {
-            "id": user.id,
-            "email": user.email,
+        current_user: dict = {
+            "id": user["id"],
+            "email": user["email"],
             "role": role,
-            "user_metadata": user.user_metadata
+            "user_metadata": user.get("user_metadata") or {}
         }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Could not validate credentials: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        
+        # Never cache past the token's own expiry
+        ttl: float = min(_token_lifetime(token), TOKEN_CACHE_TTL)
+        _token_cache.set(cache_key, current_user, ttl=ttl)
+        await cache_token_user(cache_key, current_user, ttl)
+        
+        return current_user
+    except (HTTPException, JWTError, KeyError):
+        # Token was definitively rejected (bad signature/claims or no such user) -
+        # remember it so repeats skip verification
+        _rejected_token_cache.set(cache_key, True, ttl=_token_lifetime(token) or TOKEN_CACHE_TTL)
+        raise _credentials_exception()
+    except (APIError, HTTPError):
+        # PostgREST refused the token or Supabase could not be reached; not
+        # cached since it may be transient, and a 401 (not a 500) lets optional-auth
+        # endpoints serve the caller anonymously. Cancellation propagates unchanged.
+        raise _credentials_exception()
+
+
+async def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Client = Depends(get_db)
+) -> dict:
+    """
+    Get current authenticated user from Supabase Auth token
+    
+    The outcome (user or error) is stored on request.state, so any further
+    call within the same request - including direct calls from
+    get_optional_user that bypass FastAPI's dependency cache - reuses it.
+    
+    Args:
+        request: Incoming HTTP request
+        credentials: HTTP Bearer token credentials from request header
+        db: Supabase database client
+        
+    Returns:
+        dict: Dictionary containing user id, email, role, and metadata
+        
+    Raises:
+        HTTPException: 401 if token is invalid or user not found
+    """
+    current_user: Optional[dict] = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+    auth_error: Optional[HTTPException] = getattr(request.state, "auth_error", None)
+    if auth_error is not None:
+        raise auth_error
+    
+    try:
+        current_user = await _verify_token(credentials.credentials, db)
+    except HTTPException as e:
+        request.state.auth_error = e
+        raise
+    
+    request.state.current_user = current_user
+    return current_user
 
 
 async def get_optional_user(
+    request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: Client = Depends(get_db)
 ) -> Optional[dict]:
@@ -110,17 +536,19 @@ async def get_optional_user(
     authenticated and unauthenticated users.
     
     Args:
+        request: Incoming HTTP request
         credentials: Optional HTTP Bearer token credentials
         db: Supabase database client
         
     Returns:
         Optional[dict]: User dictionary if authenticated, None otherwise
     """
-    if not credentials:
+    # Skip verification entirely for missing or obviously malformed tokens
+    if not credentials or not _looks_like_jwt(credentials.credentials):
         return None
     
     try:
-        return await get_current_user(credentials, db)
+        return await get_current_user(request, credentials, db)
     except HTTPException:
         return None
 
@@ -135,8 +563,13 @@ def require_role(allowed_roles: List[UserRole]) -> Callable:
     Returns:
         Callable: FastAPI dependency function that checks user role
     """
+    # Resolve enum values once per factory call rather than on every request
+    allowed_values: Final[FrozenSet[str]] = frozenset(role.value for role in allowed_roles)
+    allowed_mask: Final[int] = sum(ROLE_BITS[role] for role in allowed_values)
+    denied_detail: Final[str] = f"Access denied. Required roles: {sorted(allowed_values)}"
+    
     async def role_checker(
-        current_user: dict = Depends(get_current_user)
+        current_user: dict = Depends(get_current_user, use_cache=True)
     ) -> dict:
         """
         Internal function that checks if user has required role
@@ -153,10 +586,10 @@ def require_role(allowed_roles: List[UserRole]) -> Callable:
         user_role: str = current_user.get("role", "public")
         
         # Check if user role is in allowed roles
-        if user_role not in [role.value for role in allowed_roles]:
+        if not ROLE_BITS.get(user_role, 0) & allowed_mask:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {[r.value for r in allowed_roles]}"
+                detail=denied_detail
             )
         
         return current_user
@@ -165,7 +598,7 @@ def require_role(allowed_roles: List[UserRole]) -> Callable:
 
 
 async def require_admin_dashboard_access(
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user, use_cache=True)
 ) -> dict:
     """
     Require admin dashboard access - only admin or policy working group
@@ -183,7 +616,7 @@ async def require_admin_dashboard_access(
     """
     user_role: str = current_user.get("role", "public")
     
-    if user_role not in ADMIN_DASHBOARD_ROLES:
+    if not ROLE_BITS.get(user_role, 0) & ADMIN_DASHBOARD_MASK:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. Only admin and policy working group members can access the admin dashboard."
@@ -193,44 +626,17 @@ async def require_admin_dashboard_access(
 
 
 # Common role dependencies
-async def require_admin(
-    current_user: dict = Depends(require_role([UserRole.ADMIN]))
-) -> dict:
-    """
-    Require admin role only - full access to create, edit, delete policies/bylaws
-    
-    Args:
-        current_user: Current authenticated user dictionary
-        
-    Returns:
-        dict: Current user if they are admin
-        
-    Raises:
-        HTTPException: 403 if user is not admin
-    """
-    return current_user
+# Built directly from require_role so each guard is a single dependency frame
 
+# Require admin role only - full access to create, edit, delete policies/bylaws
+require_admin: Callable = require_role([UserRole.ADMIN])
 
-async def require_suggestion_manager(
-    current_user: dict = Depends(require_role([UserRole.ADMIN, UserRole.POLICY_WORKING_GROUP]))
-) -> dict:
-    """
-    Require admin or policy working group - can manage suggestions
-    
-    Args:
-        current_user: Current authenticated user dictionary
-        
-    Returns:
-        dict: Current user if they are admin or policy working group
-        
-    Raises:
-        HTTPException: 403 if user is not admin or policy working group
-    """
-    return current_user
+# Require admin or policy working group - can manage suggestions
+require_suggestion_manager: Callable = require_role([UserRole.ADMIN, UserRole.POLICY_WORKING_GROUP])
 
 
 async def require_public_or_admin(
-    current_user: Optional[dict] = Depends(get_optional_user)
+    current_user: Optional[dict] = Depends(get_optional_user, use_cache=True)
 ) -> Optional[dict]:
     """
     Allow both public and authenticated users
@@ -0,0 +1,111 @@
+"""
+ * In-Process TTL Cache
+ *
+ * This file contains a small thread-safe cache with per-entry expiry used to
+ * keep hot lookups (such as verified access tokens) off the network.
+ *
+ * Public Classes:
+ *    TTLCache
+ *        Bounded key/value cache whose entries expire after a time-to-live
+ *
+ * @author: ASA Policy App Development Team
+ * @date: October 2026
+"""
+
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded, thread-safe cache with per-entry expiry
+
+    Entries are evicted when they expire or, once maxsize is reached,
+    in least-recently-used order.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the cache
+        ttl (float): Default time-to-live of an entry in seconds
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock: RLock = RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value from the cache
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Any: Cached value, or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional time-to-live in seconds (defaults to the cache ttl)
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a key from the cache
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing
+
+        Returns:
+            Any: Removed value, or default
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Remove every entry whose value matches a predicate
+
+        Args:
+            predicate: Called with each cached value; entries returning True are removed
+        """
+        with self._lock:
+            for key in [key for key, (_, value) in self._data.items() if predicate(value)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove every entry from the cache"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -8,6 +8,10 @@
  *    Settings(BaseSettings)
  *        Pydantic settings class that loads configuration from environment variables
  *
+ * Public Functions:
+ *    get_settings() -> Settings
+ *        Build the settings once per process and return the cached instance
+ *
  * Public Variables:
  *    settings: Settings
  *        Global settings instance loaded from environment variables
@@ -16,8 +20,9 @@
  * @date: January 2026
 """
 
-from pydantic_settings import BaseSettings
-from typing import List
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Tuple
 
 
 class Settings(BaseSettings):
@@ -34,14 +39,24 @@ class Settings(BaseSettings):
         USERS_TABLE (str): Name of users table in database
         POLICY_VERSIONS_TABLE (str): Name of policy versions table in database
         POLICY_REVIEWS_TABLE (str): Name of policy reviews table in database
-        CORS_ORIGINS (List[str]): List of allowed CORS origins
-        JWT_SECRET (str): JWT secret key (if using custom JWT)
+        HTTP_MAX_CONNECTIONS (int): Max open connections per Supabase client
+        HTTP_MAX_KEEPALIVE_CONNECTIONS (int): Max idle connections kept alive per Supabase client
+        HTTP_KEEPALIVE_EXPIRY (float): Seconds an idle pooled connection is kept open
+        DB_TIMEOUT (float): Seconds before a database (PostgREST) request times out
+        CORS_ORIGINS (str): Comma-separated list of allowed CORS origins
+        LOGIN_RATE_LIMIT (int): Login attempts allowed per client IP and email per minute
+        REGISTER_RATE_LIMIT (int): Registrations allowed per admin per minute
+        USER_CACHE_ENABLED (bool): Cache users table rows for login and /me
+        REDIS_URL (str): Redis URL for the token cache shared by all workers (empty disables it)
+        JWT_SECRET (str): Supabase JWT secret - when set, access tokens are verified locally
         JWT_ALGORITHM (str): JWT algorithm
         JWT_EXPIRATION (int): JWT token expiration time in seconds
         DEBUG (bool): Debug mode flag
         ENVIRONMENT (str): Environment name (development/production)
     """
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+    
     # Supabase Configuration
     SUPABASE_URL: str
     SUPABASE_KEY: str
@@ -56,23 +71,41 @@ class Settings(BaseSettings):
     POLICY_REVIEWS_TABLE: str = "policy_reviews"
     SECTIONS_TABLE: str = "sections"
     
+    # HTTP connection pool for Supabase clients
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 60.0
+    DB_TIMEOUT: float = 30.0
+    
     # CORS
     # Can be set as comma-separated string in environment variable
     # Example: CORS_ORIGINS="http://localhost:3000,https://yourdomain.com"
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8080,http://127.0.0.1:5500,http://127.0.0.1:8000,https://policy-app-frontend-five.vercel.app,https://policy-app-frontend-637q2lfjk-augustanastudents2s-projects.vercel.app"
     
-    def get_cors_origins(self) -> List[str]:
+    @cached_property
+    def cors_origins(self) -> Tuple[str, ...]:
         """
-        Get CORS origins as a list
+        Get CORS origins as a tuple (parsed once, on first access)
         
         Returns:
-            List[str]: List of allowed CORS origins
+            Tuple[str, ...]: Allowed CORS origins
         """
-        if isinstance(self.CORS_ORIGINS, str):
-            return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
-        return self.CORS_ORIGINS if isinstance(self.CORS_ORIGINS, list) else []
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip())
+    
+    # Rate limits (attempts per minute)
+    LOGIN_RATE_LIMIT: int = 10
+    REGISTER_RATE_LIMIT: int = 20
+    
+    # In-process cache of users rows (login, /me)
+    USER_CACHE_ENABLED: bool = True
+    
+    # Shared token cache
+    # Example: REDIS_URL="redis://localhost:6379/0" (requires the redis package)
+    REDIS_URL: str = ""
     
     # JWT Settings (if using Supabase Auth)
+    # Set JWT_SECRET to the project's JWT secret (Settings -> API) to verify
+    # access tokens locally instead of calling Supabase Auth on every request
     JWT_SECRET: str = ""
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION: int = 3600  # 1 hour
@@ -80,11 +113,17 @@ class Settings(BaseSettings):
     # Application
     DEBUG: bool = False
     ENVIRONMENT: str = "development"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings (the .env file is parsed only on the first call)
     
-    class Config:
-        """Pydantic configuration"""
-        env_file = ".env"
-        case_sensitive = True
+    Returns:
+        Settings: Cached settings instance
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -5,31 +5,147 @@
  * functions for accessing Supabase database connections.
  *
  * Public Classes:
+ *    PooledPostgrestClient(SyncPostgrestClient)
+ *        PostgREST client with a sized, HTTP/2 keep-alive connection pool
+ *    PooledClient(Client)
+ *        Supabase client that uses PooledPostgrestClient for database queries
  *    SupabaseClient
  *        Singleton class for managing Supabase client instances
  *
  * Public Functions:
+ *    get_http_client() --> AsyncClient
+ *        Returns the shared async HTTP client for direct Supabase REST calls
  *    get_db() --> Client
  *        Returns Supabase client with anon key (for regular operations)
  *    get_service_db() --> Client
  *        Returns Supabase client with service role key (for admin operations)
+ *    run_query(query: Any) --> APIResponse
+ *        Executes a query builder in a worker thread (non-blocking)
+ *    returning(query: Any, columns: str) --> Any
+ *        Makes an insert/update/delete query return only the given columns
+ *    now_iso() --> str
+ *        Current UTC time as an ISO 8601 string, for created_at/updated_at values
+ *    quote_filter_value(value: str) --> str
+ *        Quotes a value for use inside a PostgREST or_() filter
+ *    search_filter(term: str, columns: Tuple[str, ...]) --> str
+ *        Builds an escaped PostgREST or_() filter for a search term (memoized)
  *
  * @author: ASA Policy App Development Team
  * @date: January 2026
 """
 
-from supabase import create_client, Client
+import asyncio
+from datetime import datetime, timezone
+from functools import lru_cache
+from threading import Lock
+from httpx import AsyncClient, AsyncHTTPTransport, HTTPTransport, Limits, Timeout
+from postgrest import APIResponse, SyncPostgrestClient
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
+from postgrest.utils import SyncClient as PostgrestSession
+from supabase import Client
+from supabase.lib.client_options import ClientOptions
+from typing import Any, Dict, Optional, Tuple, Union
 from app.core.config import settings
 
+# Connection pool shared by every request made through a client's PostgREST session.
+# Idle connections live for HTTP_KEEPALIVE_EXPIRY (httpx's default is 5 seconds),
+# so requests a few seconds apart still reuse a warm TLS connection
+HTTP_POOL_LIMITS: Limits = Limits(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+)
+
+# Retries of a failed connection attempt (e.g. a kept-alive connection the server
+# already closed). httpx only retries connecting, never a sent request, so this is
+# safe for writes
+HTTP_CONNECT_RETRIES: int = 1
+
+# Timeout for direct HTTP calls to Supabase (e.g. the Auth admin API)
+HTTP_TIMEOUT: float = 20.0
+
+_http_client: Optional[AsyncClient] = None
+
+
+def get_http_client() -> AsyncClient:
+    """
+    Get the shared async HTTP client (created on first use)
+    
+    Used for Supabase endpoints the client library does not wrap, so those
+    calls reuse kept-alive connections instead of opening a client per call.
+    
+    Returns:
+        AsyncClient: httpx client limited by HTTP_POOL_LIMITS
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = AsyncClient(
+            transport=AsyncHTTPTransport(http2=True, limits=HTTP_POOL_LIMITS, retries=HTTP_CONNECT_RETRIES),
+            timeout=HTTP_TIMEOUT
+        )
+    return _http_client
+
+
+def _client_options() -> ClientOptions:
+    """
+    Build options for a server-side Supabase client
+    
+    Token auto-refresh is off: the server does not keep user sessions alive,
+    so no refresh timers are started. Each client gets its own options (and
+    session storage). Database requests time out after DB_TIMEOUT rather than
+    the library's two minutes, so a stalled query cannot hold a pooled
+    connection for long.
+    """
+    return ClientOptions(auto_refresh_token=False, postgrest_client_timeout=settings.DB_TIMEOUT)
+
+
+class PooledPostgrestClient(SyncPostgrestClient):
+    """
+    PostgREST client whose HTTP session uses HTTP_POOL_LIMITS, HTTP/2 and
+    HTTP_CONNECT_RETRIES
+    
+    HTTP/2 lets concurrent queries multiplex over one kept-alive connection
+    instead of each paying a TCP + TLS handshake.
+    """
+    
+    def create_session(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        timeout: Union[int, float, Timeout],
+    ) -> PostgrestSession:
+        return PostgrestSession(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=HTTPTransport(http2=True, limits=HTTP_POOL_LIMITS, retries=HTTP_CONNECT_RETRIES),
+        )
+
+
+class PooledClient(Client):
+    """Supabase client that builds its PostgREST client with PooledPostgrestClient"""
+    
+    @staticmethod
+    def _init_postgrest_client(
+        rest_url: str,
+        headers: Dict[str, str],
+        schema: str,
+        timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+    ) -> SyncPostgrestClient:
+        return PooledPostgrestClient(rest_url, headers=headers, schema=schema, timeout=timeout)
+
 
 class SupabaseClient:
     """
     Singleton Supabase client class - Manages database connections
     
     This class uses the singleton pattern to ensure only one database
-    client instance is created for regular operations.
+    client instance is created per key (anon and service role), so the
+    underlying HTTP connection pool is reused across requests.
     """
     _instance: Client = None
+    _service_instance: Client = None
+    _lock: Lock = Lock()
     
     @classmethod
     def get_client(cls) -> Client:
@@ -40,27 +156,35 @@ class SupabaseClient:
             Client: Supabase client instance with anon/public key
         """
         if cls._instance is None:
-            cls._instance = create_client(
-                settings.SUPABASE_URL,
-                settings.SUPABASE_KEY
-            )
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = PooledClient(
+                        settings.SUPABASE_URL,
+                        settings.SUPABASE_KEY,
+                        options=_client_options()
+                    )
         return cls._instance
     
     @classmethod
     def get_service_client(cls) -> Client:
         """
-        Get Supabase client with service role key (for admin operations)
+        Get or create Supabase client instance with service role key
         
-        Note: This creates a new client each time (not singleton) because
-        service role key should only be used for admin operations.
+        Note: The service role key bypasses RLS, so this client should
+        still only be handed to admin operations.
         
         Returns:
             Client: Supabase client instance with service role key
         """
-        return create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_SERVICE_KEY
-        )
+        if cls._service_instance is None:
+            with cls._lock:
+                if cls._service_instance is None:
+                    cls._service_instance = PooledClient(
+                        settings.SUPABASE_URL,
+                        settings.SUPABASE_SERVICE_KEY,
+                        options=_client_options()
+                    )
+        return cls._service_instance
 
 
 def get_db() -> Client:
@@ -81,3 +205,88 @@ def get_service_db() -> Client:
         Client: Supabase client with service role key
     """
     return SupabaseClient.get_service_client()
+
+
+async def run_query(query: Any) -> APIResponse:
+    """
+    Execute a Supabase query builder without blocking the event loop
+    
+    supabase-py's client is synchronous, so the HTTP round-trip runs in a
+    worker thread. Independent queries can then overlap with asyncio.gather.
+    
+    Args:
+        query: Any Supabase/PostgREST request builder with an execute() method
+        
+    Returns:
+        APIResponse: Result of query.execute()
+    """
+    return await asyncio.to_thread(query.execute)
+
+
+def returning(query: Any, columns: str) -> Any:
+    """
+    Make an insert/update/delete query return only the given columns
+    
+    postgrest-py has no select() after update()/delete(), but PostgREST applies
+    a select parameter to the returned representation (... RETURNING columns),
+    so the changed rows come back in the same request without their full bodies.
+    
+    Args:
+        query: Supabase/PostgREST insert, update or delete request builder
+        columns: Comma-separated columns to return
+        
+    Returns:
+        Any: The same query, for chaining into run_query
+    """
+    query.params = query.params.add("select", columns)
+    return query
+
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with offset, for created_at/updated_at"""
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+def quote_filter_value(value: str) -> str:
+    """
+    Quote a value for use inside a PostgREST or_() filter
+    
+    The value is double-quoted with backslashes and quotes escaped, so commas,
+    parentheses and dots in user input cannot change the filter's structure.
+    
+    Args:
+        value: Raw value
+        
+    Returns:
+        str: Double-quoted value, e.g. for f"email.eq.{quote_filter_value(email)}"
+    """
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+@lru_cache(maxsize=1024)
+def search_filter(term: str, columns: Tuple[str, ...]) -> str:
+    """
+    Build a PostgREST or_() filter matching a search term in any of the columns
+    
+    Columns are matched case-insensitively as substrings (ILIKE), so they
+    must be text (e.g. a generated text copy of an integer column). The term
+    is escaped so LIKE wildcards and PostgREST syntax (commas, parentheses,
+    quotes) in user input are matched literally.
+    
+    Results are memoized, so repeated searches skip the escaping passes.
+    Column arguments must therefore be tuples (hashable).
+    
+    Args:
+        term: Raw search term from the user
+        columns: Text columns to search
+        
+    Returns:
+        str: Filter string for query.or_()
+    """
+    # Escape LIKE wildcards; "*" is PostgREST's wildcard and cannot be escaped
+    pattern: str = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_").replace("*", "")
+    # Quote as a PostgREST value
+    quoted: str = quote_filter_value(f"*{pattern}*")
+    
+    return ",".join(f"{column}.ilike.{quoted}" for column in columns)
+
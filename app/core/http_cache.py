@@ -0,0 +1,73 @@
+"""
+ * HTTP Conditional Responses
+ *
+ * This file contains the ETag helpers shared by the routers whose list and
+ * detail responses can be revalidated with If-None-Match.
+ *
+ * Public Functions:
+ *    make_etag(body: bytes) --> str
+ *        Computes a weak ETag for a serialized response body
+ *    etag_response(request: Request, body: bytes, etag: str, cache_control: str,
+ *      headers: Optional[dict]) --> Response
+ *        Builds a 200 JSON response, or 304 Not Modified if the client already has it
+ *
+ * @author: ASA Policy App Development Team
+ * @date: October 2026
+"""
+
+import hashlib
+from fastapi import Request, Response
+from typing import Optional
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Compute a weak ETag for a serialized response body
+
+    The tag is weak because GZipMiddleware may compress the body after it is
+    computed: the bytes on the wire then differ from the hashed bytes, but the
+    content is semantically the same.
+
+    Args:
+        body: Serialized JSON body
+
+    Returns:
+        str: Weak ETag, W/"<hash>"
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """Strip the weak prefix so If-None-Match uses weak comparison"""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: str,
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    Build a cacheable JSON response, or 304 Not Modified if the client already has it
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        body: Serialized JSON body
+        etag: ETag of body (from make_etag)
+        cache_control: Cache-Control header value
+        headers: Extra response headers (e.g. a next-page cursor)
+
+    Returns:
+        Response: 200 with the body, or 304 with no body
+    """
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": cache_control}
+    if_none_match: Optional[str] = request.headers.get("if-none-match")
+    if if_none_match:
+        if if_none_match.strip() == "*" or _opaque_tag(etag) in {
+            _opaque_tag(tag) for tag in if_none_match.split(",")
+        }:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,56 @@
+"""
+ * Request Rate Limiting
+ *
+ * This file contains a small in-process token bucket limiter used to shed
+ * abusive traffic (e.g. credential stuffing against /login) before any
+ * Supabase call is made.
+ *
+ * Public Classes:
+ *    RateLimiter
+ *        Per-key token bucket allowing a number of requests per period
+ *
+ * @author: ASA Policy App Development Team
+ * @date: October 2026
+"""
+
+import time
+from typing import Hashable, Tuple
+from app.core.cache import TTLCache
+
+
+class RateLimiter:
+    """
+    Per-key token bucket
+
+    Each key may make `capacity` requests in a burst; tokens refill evenly
+    over `period` seconds. Buckets idle for a full period are dropped, since
+    they would be full again anyway.
+
+    Attributes:
+        capacity (int): Maximum requests in a burst
+        period (float): Seconds for an empty bucket to refill completely
+    """
+
+    def __init__(self, capacity: int, period: float, maxsize: int = 100_000) -> None:
+        self.capacity: int = capacity
+        self.period: float = period
+        self._refill_rate: float = capacity / period
+        self._buckets: TTLCache = TTLCache(maxsize=maxsize, ttl=period)
+
+    def allow(self, key: Hashable) -> bool:
+        """
+        Take a token from a key's bucket
+
+        Args:
+            key: Bucket key (e.g. client IP, or IP and email)
+
+        Returns:
+            bool: True if the request may proceed, False if it should be rejected
+        """
+        now: float = time.monotonic()
+        tokens, last = self._buckets.get(key, (float(self.capacity), now))
+        tokens = min(float(self.capacity), tokens + (now - last) * self._refill_rate)
+        allowed: bool = tokens >= 1
+        bucket: Tuple[float, float] = (tokens - 1 if allowed else tokens, now)
+        self._buckets.set(key, bucket)
+        return allowed
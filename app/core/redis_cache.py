@@ -0,0 +1,157 @@
+"""
+ * Shared Redis Token Cache
+ *
+ * This file contains an optional second-level cache for verified access
+ * tokens, shared by every worker through Redis. It is only active when
+ * REDIS_URL is configured; otherwise every function is a no-op.
+ *
+ * Public Functions:
+ *    get_redis() --> Optional[Redis]
+ *        Gets the shared Redis client, or None when Redis is not configured
+ *    get_cached_token_user(cache_key: str) --> Optional[dict]
+ *        Gets a verified user by token hash
+ *    cache_token_user(cache_key: str, user: dict, ttl: float) --> None
+ *        Stores a verified user by token hash
+ *    invalidate_user_tokens(user_id: str) --> None
+ *        Deletes a user's cached tokens and notifies the other workers
+ *    listen_for_invalidations(on_invalidate: Callable[[str], None]) --> None
+ *        Background task that applies invalidations published by other workers
+ *
+ * @author: ASA Policy App Development Team
+ * @date: October 2026
+"""
+
+import asyncio
+import logging
+import orjson
+from threading import Lock
+from typing import Callable, Final, Optional
+from app.core.config import settings
+
+try:
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError
+except ImportError:  # redis is only required when REDIS_URL is set
+    Redis = None
+    RedisError = OSError
+
+logger = logging.getLogger(__name__)
+
+# Key layout: one key per verified token, plus a set of token keys per user
+# so a role change can delete every token the user holds
+TOKEN_KEY_PREFIX: Final[str] = "auth:"
+USER_TOKENS_KEY_PREFIX: Final[str] = "auth:user:"
+INVALIDATION_CHANNEL: Final[str] = "auth_invalidate"
+
+# Lifetime of a user's token set - at least as long as any token entry
+# (token entries never outlive auth.TOKEN_CACHE_TTL)
+USER_TOKENS_TTL: Final[int] = 60  # seconds
+
+_redis: Optional["Redis"] = None
+_lock: Lock = Lock()
+
+
+def get_redis() -> Optional["Redis"]:
+    """
+    Get the shared Redis client (created on first use)
+
+    Returns:
+        Optional[Redis]: Redis client backed by a connection pool, or None if
+        REDIS_URL is not set or the redis package is not installed
+    """
+    global _redis
+    if not settings.REDIS_URL or Redis is None:
+        return None
+    if _redis is None:
+        with _lock:
+            if _redis is None:
+                _redis = Redis.from_url(settings.REDIS_URL, max_connections=settings.HTTP_MAX_CONNECTIONS)
+    return _redis
+
+
+async def get_cached_token_user(cache_key: str) -> Optional[dict]:
+    """
+    Get a verified user from Redis by token hash
+
+    Args:
+        cache_key: sha256 hex digest of the access token
+
+    Returns:
+        Optional[dict]: Cached user, or None on a miss or if Redis is unavailable
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        value = await redis.get(TOKEN_KEY_PREFIX + cache_key)
+    except RedisError:
+        return None
+    return orjson.loads(value) if value else None
+
+
+async def cache_token_user(cache_key: str, user: dict, ttl: float) -> None:
+    """
+    Store a verified user in Redis by token hash
+
+    Args:
+        cache_key: sha256 hex digest of the access token
+        user: Verified user (id, email, role, user_metadata)
+        ttl: Time-to-live in seconds; entries shorter than a second are skipped
+    """
+    redis = get_redis()
+    seconds: int = int(ttl)
+    if redis is None or seconds <= 0:
+        return
+    user_tokens_key: str = USER_TOKENS_KEY_PREFIX + str(user["id"])
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(TOKEN_KEY_PREFIX + cache_key, orjson.dumps(user), ex=seconds)
+            pipe.sadd(user_tokens_key, cache_key)
+            pipe.expire(user_tokens_key, USER_TOKENS_TTL)
+            await pipe.execute()
+    except RedisError:
+        pass
+
+
+async def invalidate_user_tokens(user_id: str) -> None:
+    """
+    Delete a user's cached tokens from Redis and tell every worker to purge them
+
+    Args:
+        user_id: ID of the user whose role changed or who was deleted
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    user_tokens_key: str = USER_TOKENS_KEY_PREFIX + str(user_id)
+    try:
+        token_keys = await redis.smembers(user_tokens_key)
+        await redis.delete(user_tokens_key, *(TOKEN_KEY_PREFIX + key.decode() for key in token_keys))
+        await redis.publish(INVALIDATION_CHANNEL, str(user_id))
+    except RedisError as e:
+        logger.warning("Could not invalidate cached tokens for user %s: %s", user_id, e)
+
+
+async def listen_for_invalidations(on_invalidate: Callable[[str], None]) -> None:
+    """
+    Call on_invalidate(user_id) for every invalidation published by any worker
+
+    Intended to run as a background task for the lifetime of the app.
+    Reconnects after a short delay if the connection drops.
+
+    Args:
+        on_invalidate: Callback that purges the user from in-process caches
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    while True:
+        try:
+            async with redis.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        on_invalidate(message["data"].decode())
+        except RedisError as e:
+            logger.warning("Lost Redis invalidation subscription: %s", e)
+            await asyncio.sleep(5)
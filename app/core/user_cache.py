@@ -0,0 +1,104 @@
+"""
+ * Users Table Row Cache
+ *
+ * This file contains an in-process cache of users table rows keyed by both
+ * id and email, so login and /me resolve a user's role and name without a
+ * database round-trip on repeat requests.
+ *
+ * Public Variables:
+ *    user_cache: TTLCache
+ *        Users rows keyed by ("id", user_id) and ("email", email)
+ *
+ * Public Functions:
+ *    get_cached_user(db: Client, user_id: Optional[str], email: Optional[str]) --> Optional[dict]
+ *        Gets a user row by id or email from cache, falling back to the database
+ *    forget_user(user_id: str, email: Optional[str]) --> None
+ *        Removes a user row from cache after it is written or deleted
+ *
+ * @author: ASA Policy App Development Team
+ * @date: October 2026
+"""
+
+from typing import Final, List, Optional
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import quote_filter_value, run_query
+from supabase import Client
+
+# Columns of a users row returned by the API (everything UserResponse needs)
+USER_COLUMNS: Final[str] = "id,email,name,role,created_at"
+
+# Writes on this worker update the cache directly, and other workers are told
+# through Redis when REDIS_URL is set. Without Redis, another worker can serve a
+# changed role until its entry expires, so keep this short
+USER_CACHE_TTL: Final[int] = 60  # seconds
+user_cache: Final[TTLCache] = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL)
+
+
+def _store_user(row: dict) -> None:
+    """Cache a users row under both its id and its email"""
+    user_cache.set(("id", str(row["id"])), row)
+    if row.get("email"):
+        user_cache.set(("email", row["email"]), row)
+
+
+async def get_cached_user(db: Client, user_id: Optional[str], email: Optional[str] = None) -> Optional[dict]:
+    """
+    Get a users row by id or email, from cache when possible
+
+    A row matching the id is preferred. When an email is given, a row matching
+    only the email may be returned - callers compare its id to detect an id
+    mismatch between Auth and the users table.
+
+    Args:
+        db: Supabase database client
+        user_id: Auth user ID (None to match on email only)
+        email: Optional email to match when no row has the id
+
+    Returns:
+        Optional[dict]: Users row, or None if no row matches
+    """
+    user_id = str(user_id) if user_id else None
+    if settings.USER_CACHE_ENABLED:
+        row: Optional[dict] = user_cache.get(("id", user_id)) if user_id else None
+        if row is None and email:
+            row = user_cache.get(("email", email))
+        if row is not None:
+            return dict(row)  # callers may change it; the cached row stays intact
+
+    # Values are quoted so a "," or '"' in them cannot rewrite the filter
+    filters: List[str] = []
+    if user_id:
+        filters.append(f"id.eq.{quote_filter_value(user_id)}")
+    if email:
+        filters.append(f"email.eq.{quote_filter_value(email)}")
+    if not filters:
+        return None
+
+    # id and email are both unique, so at most two rows match
+    response = await run_query(
+        db.table(settings.USERS_TABLE).select(USER_COLUMNS).or_(",".join(filters)).limit(2)
+    )
+    if not response.data:
+        return None
+
+    row = next((r for r in response.data if str(r["id"]) == user_id), response.data[0])
+    if settings.USER_CACHE_ENABLED:
+        _store_user(dict(row))
+    return row
+
+
+def forget_user(user_id: str, email: Optional[str] = None) -> None:
+    """
+    Remove a user's rows from the cache
+
+    Args:
+        user_id: User ID
+        email: User email; when omitted, any row with this id is removed
+    """
+    user_id = str(user_id)
+    user_cache.pop(("id", user_id))
+    if email:
+        user_cache.pop(("email", email))
+    else:
+        user_cache.discard_where(lambda row: str(row["id"]) == user_id)
@@ -24,12 +24,16 @@
  * @date: January 2026
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
 
+# Shared config for response schemas - built from trusted DB rows, never mutated
+RESPONSE_MODEL_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+
 class PolicyStatus(str, Enum):
     """Policy status enumeration"""
     DRAFT = "draft"
@@ -67,8 +71,7 @@ class PolicyResponse(PolicyBase):
     created_by: Optional[str] = None
     updated_by: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
 
 
 # Bylaw Schemas
@@ -101,8 +104,7 @@ class BylawResponse(BylawBase):
     created_by: Optional[str] = None
     updated_by: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
 
 
 # Suggestion Schemas
@@ -144,8 +146,7 @@ class SuggestionResponse(SuggestionBase):
     bylaw_number: Optional[int] = Field(None, description="Bylaw number if suggestion is for a bylaw")
     bylaw_title: Optional[str] = Field(None, description="Bylaw title if suggestion is for a bylaw")
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
 
 
 # User Schemas
@@ -168,8 +169,7 @@ class UserResponse(UserBase):
     id: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
 
 
 # Search and Filter Schemas
@@ -238,5 +238,4 @@ class SectionResponse(SectionBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
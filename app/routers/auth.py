@@ -6,7 +6,7 @@
  * management, and role-based access control.
  *
  * Public Functions:
- *    login(login_data: LoginRequest, db: Client) --> LoginResponse
+ *    login(request: Request, login_data: LoginRequest, db: Client) --> LoginResponse
  *        Authenticates user and returns access token (admin or policy_working_group only)
  *    register(register_data: RegisterRequest, current_user: dict, db: Client) --> LoginResponse
  *        Registers a new user (admin only, assigns policy_working_group role)
@@ -14,8 +14,8 @@
  *        Gets current authenticated user information
  *    logout(current_user: dict, db: Client) --> dict
  *        Logs out the current user
- *    get_all_users(current_user: dict, db: Client) --> List[UserResponse]
- *        Gets all users (admin only)
+ *    get_all_users(limit: int, offset: int, current_user: dict, db: Client) --> List[UserResponse]
+ *        Gets a page of users, with the total count in X-Total-Count (admin only)
  *    update_user_role(user_id: str, role_data: UpdateUserRoleRequest,
  *      current_user: dict, db: Client) --> UserResponse
  *        Updates a user's role (admin only)
@@ -24,21 +24,95 @@
  * @date: January 2026
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
-from app.core.database import get_db, get_service_db
-from app.core.auth import get_current_user, get_optional_user, require_admin
+import asyncio
+import logging
+import re
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel
+from typing import Annotated, Final, Optional, List
+from app.core.database import get_db, get_http_client, get_service_db, returning, run_query
+from app.core.user_cache import USER_COLUMNS, get_cached_user, forget_user
+from app.core.rate_limit import RateLimiter
+from app.core.auth import (
+    get_current_user, get_optional_user, require_admin, ADMIN_DASHBOARD_ROLES,
+    cache_user, invalidate_user
+)
 from app.models.schemas import UserResponse, UserRole
 from app.core.config import settings
 from supabase import Client
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Basic shape check for emails (matched against the whole string) - Supabase
+# Auth does the authoritative validation
+_EMAIL_RE: Final[re.Pattern] = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _normalize_email(value: str) -> str:
+    """
+    Validate an email's shape and lowercase its domain
+    
+    Only the domain is case-insensitive; the local part is kept as entered so
+    existing mixed-case accounts still match (as pydantic's EmailStr did).
+    """
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    local, domain = value.rsplit("@", 1)
+    return f"{local}@{domain.lower()}"
+
+
+Email = Annotated[str, AfterValidator(_normalize_email)]
+
+# Static error responses, built once rather than on every failed request
+_HTTP_401_INVALID: Final[HTTPException] = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid email or password"
+)
+_HTTP_401_UNCONFIRMED: Final[HTTPException] = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Email not confirmed. Please check your email and verify your account."
+)
+_HTTP_400_REGISTRATION_FAILED: Final[HTTPException] = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Registration failed"
+)
+_HTTP_404_USER_NOT_FOUND: Final[HTTPException] = HTTPException(
+    status_code=status.HTTP_404_NOT_FOUND,
+    detail="User not found"
+)
+_HTTP_400_DELETE_SELF: Final[HTTPException] = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="You cannot delete your own account"
+)
+_HTTP_429_TOO_MANY_ATTEMPTS: Final[HTTPException] = HTTPException(
+    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+    detail="Too many attempts. Please wait a minute and try again.",
+    headers={"Retry-After": "60"}
+)
+
+# Attempts per minute - checked before any Supabase call is made. Logins are
+# limited per client IP and email; registrations per admin (checked after
+# require_admin, so only admins can use up the budget)
+_login_limiter: Final[RateLimiter] = RateLimiter(capacity=settings.LOGIN_RATE_LIMIT, period=60)
+_register_limiter: Final[RateLimiter] = RateLimiter(capacity=settings.REGISTER_RATE_LIMIT, period=60)
+
+
+def _client_ip(request: Request) -> str:
+    """
+    Get the client's IP address for rate limiting
+    
+    Behind Render's proxy this is only the real client address because uvicorn
+    runs with --proxy-headers (see Procfile), which applies X-Forwarded-For.
+    """
+    return request.client.host if request.client else "unknown"
+
 
 class LoginRequest(BaseModel):
     """Login request schema"""
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -57,112 +131,82 @@ class DeleteUserResponse(BaseModel):
 
 class RegisterRequest(BaseModel):
     """Registration request schema"""
-    email: EmailStr
+    email: Email
     password: str
     name: Optional[str] = None
 
 
 @router.post("/login", response_model=LoginResponse)
 async def login(
+    request: Request,
     login_data: LoginRequest,
     db: Client = Depends(get_db)
 ):
     """Login endpoint using Supabase Auth - Only admin, council, and policy working group can login"""
+    # Shed repeated attempts for the same client and account before calling Supabase
+    if not _login_limiter.allow((_client_ip(request), login_data.email)):
+        raise _HTTP_429_TOO_MANY_ATTEMPTS
+    
     try:
-        # Sign in with Supabase Auth
-        auth_response = db.auth.sign_in_with_password({
+        # Sign in with Supabase Auth; the users row is only looked up once the
+        # password has been accepted, so failed attempts cost no users query
+        auth_response = await asyncio.to_thread(db.auth.sign_in_with_password, {
             "email": login_data.email,
             "password": login_data.password
         })
         
         if not auth_response or not auth_response.user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
-            )
+            raise _HTTP_401_INVALID
         
         user = auth_response.user
         
         # Check if session exists (may be None if email confirmation required)
         if not auth_response.session:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Email not confirmed. Please check your email and verify your account."
-            )
+            raise _HTTP_401_UNCONFIRMED
         
         access_token = auth_response.session.access_token
         
-        # Get user role from users table - check by both id and email
-        user_data = db.table(settings.USERS_TABLE).select("*").eq("id", user.id).execute()
+        # One lookup matching either id or email (a row found only by email
+        # belongs to a different id and is re-keyed below)
+        user_row: Optional[dict] = await get_cached_user(db, user.id, user.email)
         
-        # If not found by id, try by email (in case of ID mismatch)
-        if not user_data.data:
-            user_data = db.table(settings.USERS_TABLE).select("*").eq("email", user.email).execute()
-            # If found by email but ID doesn't match, update the ID
-            if user_data.data:
-                existing_user = user_data.data[0]
-                # Update the user record to use the correct ID from Auth
-                db.table(settings.USERS_TABLE).update({
-                    "id": user.id
-                }).eq("email", user.email).execute()
-                user_data = db.table(settings.USERS_TABLE).select("*").eq("id", user.id).execute()
+        if user_row is None:
+            # User doesn't exist in users table - create with the default (public) role.
+            # ON CONFLICT (id) DO NOTHING makes concurrent first logins single-winner;
+            # a loser gets no row back and reads the winner's row instead.
+            response = await run_query(db.table(settings.USERS_TABLE).upsert({
+                "id": user.id,
+                "email": user.email
+            }, on_conflict="id", ignore_duplicates=True))
+            user_row = response.data[0] if response.data else await get_cached_user(db, user.id, user.email)
+        elif str(user_row["id"]) != str(user.id):
+            # Found by email under a different ID - re-key it to the Auth user ID,
+            # keeping the role and name already stored
+            response = await run_query(returning(
+                db.table(settings.USERS_TABLE).update({"id": user.id}).eq("email", user.email),
+                USER_COLUMNS
+            ))
+            forget_user(user_row["id"], user.email)
+            user_row = response.data[0] if response.data else None
         
-        if user_data.data:
-            role = user_data.data[0].get("role", "public")
-            name = user_data.data[0].get("name")
-        else:
-            # User doesn't exist in users table - try to create with public role
-            # Handle case where user might already exist (race condition or email conflict)
-            try:
-                db.table(settings.USERS_TABLE).insert({
-                    "id": user.id,
-                    "email": user.email,
-                    "role": "public",
-                    "name": None
-                }).execute()
-                # Re-fetch to get the created user
-                user_data = db.table(settings.USERS_TABLE).select("*").eq("id", user.id).execute()
-                if user_data.data:
-                    role = user_data.data[0].get("role", "public")
-                    name = user_data.data[0].get("name")
-                else:
-                    role = "public"
-                    name = None
-            except Exception as insert_error:
-                # If insert fails (e.g., duplicate email), try to fetch by email
-                user_data = db.table(settings.USERS_TABLE).select("*").eq("email", user.email).execute()
-                if user_data.data:
-                    # Update the ID to match Auth user ID
-                    db.table(settings.USERS_TABLE).update({
-                        "id": user.id
-                    }).eq("email", user.email).execute()
-                    user_data = db.table(settings.USERS_TABLE).select("*").eq("id", user.id).execute()
-                    if user_data.data:
-                        role = user_data.data[0].get("role", "public")
-                        name = user_data.data[0].get("name")
-                    else:
-                        role = "public"
-                        name = None
-                else:
-                    # If we still can't find/create the user, default to public
-                    role = "public"
-                    name = None
-            
-            # Deny login since they have public role (or couldn't be created)
+        if user_row is None:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied. Only admin and policy working group members can access the admin dashboard. Please contact an administrator to upgrade your account."
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Could not create or load the user's profile"
             )
         
+        role = user_row.get("role", "public")
+        name = user_row.get("name")
+        
         # Check if user has permission to access admin dashboard
         # Only admin and policy_working_group can login
-        if role not in ["admin", "policy_working_group"]:
+        if role not in ADMIN_DASHBOARD_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Your current role is '{role}'. Only admin and policy working group members can access the admin dashboard. Please contact an administrator to upgrade your account."
             )
         
-        return {
+        return ORJSONResponse({
             "access_token": access_token, # Delete this later before deployment
             "token_type": "bearer",
             "user": {
@@ -171,7 +215,7 @@ async def login(
                 "name": name,
                 "role": role
             }
-        }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -203,24 +247,29 @@ async def register(
         LoginResponse: Access token and user information
         
     Raises:
-        HTTPException: 400 if registration fails, 403 if not admin
+        HTTPException: 400 if registration fails, 403 if not admin, 429 if the
+        admin registered too many users in the last minute
     """
+    if not _register_limiter.allow(current_user["id"]):
+        raise _HTTP_429_TOO_MANY_ATTEMPTS
+    
     try:
         # Create user with Supabase Auth ADMIN API so no confirmation email is sent.
         # This requires the service role key and marks the email as confirmed.
+        # The on_auth_user_created trigger mirrors the user into the users table with
+        # the role from app_metadata (only settable with the service role key).
         auth_response = None
         try:
             admin_auth = db.auth.admin
-            auth_response = admin_auth.create_user({
+            auth_response = await asyncio.to_thread(admin_auth.create_user, {
                 "email": register_data.email,
                 "password": register_data.password,
                 "email_confirm": True,
                 "user_metadata": {"name": register_data.name},
+                "app_metadata": {"role": UserRole.POLICY_WORKING_GROUP.value},
             })
         except Exception:
             # Fallback to raw HTTP if admin helper isn't available in this supabase client version
-            import httpx
-
             url = settings.SUPABASE_URL.rstrip("/") + "/auth/v1/admin/users"
             headers = {
                 "apikey": settings.SUPABASE_SERVICE_KEY,
@@ -232,31 +281,30 @@ async def register(
                 "password": register_data.password,
                 "email_confirm": True,
                 "user_metadata": {"name": register_data.name},
+                "app_metadata": {"role": UserRole.POLICY_WORKING_GROUP.value},
             }
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                r = await client.post(url, headers=headers, json=payload)
-                if r.status_code >= 400:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Registration failed: {r.text}",
-                    )
-                auth_response = type("AuthResp", (), {"user": type("User", (), r.json())})()
+            r = await get_http_client().post(url, headers=headers, json=payload)
+            if r.status_code >= 400:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Registration failed: {r.text}",
+                )
+            auth_response = type("AuthResp", (), {"user": type("User", (), r.json())})()
         
         if not auth_response or not auth_response.user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Registration failed"
-            )
+            raise _HTTP_400_REGISTRATION_FAILED
         
         user = auth_response.user
         
-        # Create user record in users table with policy_working_group role
-        db.table(settings.USERS_TABLE).insert({
+        # Users row was created by the trigger with policy_working_group role
+        new_user: dict = {
             "id": user.id,
             "email": user.email,
-            "role": "policy_working_group",  # Default to policy_working_group role
+            "role": UserRole.POLICY_WORKING_GROUP.value,
             "name": register_data.name
-        }).execute()
+        }
+        forget_user(user.id, user.email)
+        cache_user(new_user)
         
         # For admin-created users, we don't create a session here.
         # The user can log in normally with email/password immediately.
@@ -287,27 +335,22 @@ async def get_current_user_info(
     db: Client = Depends(get_db)
 ):
     """Get current authenticated user information"""
-    # Get full user data from users table
-    user_data = db.table(settings.USERS_TABLE).select("*").eq("id", current_user["id"]).execute()
+    # Get full user data from users table (cached)
+    user_record: Optional[dict] = await get_cached_user(db, current_user["id"])
     
-    if user_data.data:
-        user_record = user_data.data[0]
-        return {
-            "id": user_record["id"],
-            "email": user_record["email"],
-            "name": user_record.get("name"),
-            "role": user_record.get("role", "public"),
-            "created_at": user_record.get("created_at")
-        }
+    # Rows come from the database already in UserResponse shape, so they are
+    # serialized directly rather than re-validated (response_model documents them)
+    if user_record:
+        return ORJSONResponse(user_record)
     
     # Fallback to auth user data
-    return {
+    return ORJSONResponse({
         "id": current_user["id"],
         "email": current_user["email"],
         "name": current_user.get("user_metadata", {}).get("name"),
         "role": current_user.get("role", "public"),
         "created_at": None
-    }
+    })
 
 
 @router.post("/logout")
@@ -318,7 +361,7 @@ async def logout(
     """Logout endpoint"""
     try:
         # Sign out from Supabase Auth
-        db.auth.sign_out()
+        await asyncio.to_thread(db.auth.sign_out)
         return {"message": "Logged out successfully"}
     except Exception as e:
         # Even if sign_out fails, return success
@@ -327,30 +370,22 @@ async def logout(
 
 @router.get("/users", response_model=List[UserResponse])
 async def get_all_users(
-    current_user: dict = Depends(get_current_user),
-    db: Client = Depends(get_service_db)  # Admin only
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    current_user: dict = Depends(require_admin),
+    db: Client = Depends(get_service_db)
 ):
-    """Get all users (admin only)"""
-    # Check if user is admin (not council or policy_working_group)
-    user_role = current_user.get("role", "public")
-    if user_role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Admin role required."
-        )
-    
+    """Get a page of users, newest first; the total user count is in X-Total-Count (admin only)"""
     try:
-        response = db.table(settings.USERS_TABLE).select("*").order("created_at", desc=True).execute()
-        return [
-            {
-                "id": user["id"],
-                "email": user["email"],
-                "name": user.get("name"),
-                "role": user.get("role", "public"),
-                "created_at": user.get("created_at")
-            }
-            for user in response.data
-        ]
+        response = await run_query(
+            db.table(settings.USERS_TABLE)
+            .select(USER_COLUMNS, count="exact")
+            .order("created_at", desc=True)
+            .range(offset, offset + limit - 1)
+        )
+        # Rows already have the UserResponse shape - serialize them straight to JSON
+        # with orjson (response_model still documents the shape)
+        return ORJSONResponse(response.data, headers={"X-Total-Count": str(response.count or 0)})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -367,38 +402,40 @@ class UpdateUserRoleRequest(BaseModel):
 async def update_user_role(
     user_id: str,
     role_data: UpdateUserRoleRequest,
-    current_user: dict = Depends(get_current_user),
-    db: Client = Depends(get_service_db)  # Admin only
+    current_user: dict = Depends(require_admin),
+    db: Client = Depends(get_service_db)
 ):
     """Update user role (admin only)"""
-    # Check if current user is admin (not council or policy_working_group)
-    user_role = current_user.get("role", "public")
-    if user_role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Admin role required."
-        )
-    
     try:
-        # Update user role
-        response = db.table(settings.USERS_TABLE).update({
-            "role": role_data.role.value
-        }).eq("id", user_id).execute()
+        # Update user role, returning only the UserResponse columns in the same
+        # request. Rows already holding the role are not touched, so no row back
+        # means either no such user or nothing to change
+        new_role: str = role_data.role.value
+        response = await run_query(returning(
+            db.table(settings.USERS_TABLE).update({"role": new_role}).eq("id", user_id)
+            .or_(f"role.is.null,role.neq.{new_role}"),
+            USER_COLUMNS
+        ))
         
         if not response.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
+            existing = await run_query(
+                db.table(settings.USERS_TABLE).select(USER_COLUMNS).eq("id", user_id).limit(1)
             )
+            if not existing.data:
+                raise _HTTP_404_USER_NOT_FOUND
+            # Role unchanged - keep the user's sessions and cached tokens
+            return ORJSONResponse(existing.data[0])
         
         user = response.data[0]
-        return {
-            "id": user["id"],
-            "email": user["email"],
-            "name": user.get("name"),
-            "role": user.get("role", "public"),
-            "created_at": user.get("created_at")
-        }
+        # Sign the user out everywhere (revokes refresh tokens so they must log in
+        # again under the new role) while every worker drops their cached tokens.
+        # The role change is already committed, so a failed revoke is only logged
+        await asyncio.gather(
+            _revoke_user_sessions(db, user_id),
+            invalidate_user(user_id)
+        )
+        cache_user(user)
+        return ORJSONResponse(user)
     except HTTPException:
         raise
     except Exception as e:
@@ -408,65 +445,80 @@ async def update_user_role(
         )
 
 
+async def _revoke_user_sessions(db: Client, user_id: str) -> bool:
+    """
+    Sign a user out of every session (revokes their refresh tokens)
+    
+    Args:
+        db: Supabase database client with service role
+        user_id: ID of the user whose sessions are revoked
+        
+    Returns:
+        bool: True if the sessions were revoked
+    """
+    try:
+        await run_query(db.rpc("revoke_user_sessions", {"uid": user_id}))
+        return True
+    except Exception as revoke_error:
+        # The role change stands (roles are read from the users table, not the
+        # token); the user just stays signed in on their existing sessions
+        logger.warning("Could not revoke sessions for user %s: %s", user_id, revoke_error)
+        return False
+
+
+async def _delete_auth_user(db: Client, user_id: str) -> bool:
+    """
+    Delete a user from Supabase Auth
+    
+    Args:
+        db: Supabase database client with service role
+        user_id: ID of the user to delete
+        
+    Returns:
+        bool: True if the Auth account was deleted
+    """
+    try:
+        admin_auth = getattr(getattr(db, "auth", None), "admin", None)
+        if admin_auth and hasattr(admin_auth, "delete_user"):
+            await asyncio.to_thread(admin_auth.delete_user, user_id)
+            return True
+        url = settings.SUPABASE_URL.rstrip("/") + f"/auth/v1/admin/users/{user_id}"
+        headers = {
+            "apikey": settings.SUPABASE_SERVICE_KEY,
+            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY}",
+        }
+        r = await get_http_client().delete(url, headers=headers)
+        return r.status_code < 400
+    except Exception as auth_error:
+        # The profile row is still deleted; the response says auth deletion failed
+        logger.warning("Could not delete user from auth: %s", auth_error)
+        return False
+
+
 @router.delete("/users/{user_id}", status_code=200, response_model=DeleteUserResponse)
 async def delete_user(
     user_id: str,
-    current_user: dict = Depends(get_current_user),
-    db: Client = Depends(get_service_db)  # Admin only
+    current_user: dict = Depends(require_admin),
+    db: Client = Depends(get_service_db)
 ) -> DeleteUserResponse:
     """Delete a user (admin only)"""
-    # Check if current user is admin (not council or policy_working_group)
-    user_role = current_user.get("role", "public")
-    if user_role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Admin role required."
-        )
-    
     # Prevent deleting yourself
     if user_id == current_user.get("id"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You cannot delete your own account"
-        )
+        raise _HTTP_400_DELETE_SELF
     
     try:
-        # Check if user exists
-        user_check = db.table(settings.USERS_TABLE).select("*").eq("id", user_id).execute()
-        if not user_check.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
+        # Delete the users row first (returning its email); an unknown id is a
+        # 404 before the Auth account is touched
+        delete_response = await run_query(db.rpc("delete_user_row", {"uid": user_id}))
+        if not delete_response.data:
+            raise _HTTP_404_USER_NOT_FOUND
+        user_email: Optional[str] = delete_response.data[0]["email"]
         
-        user_to_delete = user_check.data[0]
-        user_email = user_to_delete.get("email")
-
-        # Delete from Supabase Auth first (prevents orphan auth accounts)
-        auth_deleted = False
-        try:
-            admin_auth = getattr(getattr(db, "auth", None), "admin", None)
-            if admin_auth and hasattr(admin_auth, "delete_user"):
-                admin_auth.delete_user(user_id)
-                auth_deleted = True
-            else:
-                import httpx
-
-                url = settings.SUPABASE_URL.rstrip("/") + f"/auth/v1/admin/users/{user_id}"
-                headers = {
-                    "apikey": settings.SUPABASE_SERVICE_KEY,
-                    "Authorization": f"Bearer {settings.SUPABASE_SERVICE_KEY}",
-                }
-                async with httpx.AsyncClient(timeout=20.0) as client:
-                    r = await client.delete(url, headers=headers)
-                    if r.status_code < 400:
-                        auth_deleted = True
-        except Exception as auth_error:
-            # We'll still delete the profile row, but return a message indicating auth deletion failed
-            print(f"Warning: Could not delete user from auth: {auth_error}")
-
-        # Delete from users table
-        db.table(settings.USERS_TABLE).delete().eq("id", user_id).execute()
+        # Only then delete the Auth account, while every worker drops cached tokens
+        auth_deleted, _ = await asyncio.gather(
+            _delete_auth_user(db, user_id),
+            invalidate_user(user_id)
+        )
         
         return {
             "message": (
@@ -8,12 +8,16 @@
  * Public Functions:
  *    convert_bylaw_from_db(row: dict) --> dict
  *        Converts a database row to bylaw response format
+ *    invalidate_approved_bylaws() --> None
+ *        Drops cached approved-bylaw responses after a write
  *    get_bylaws(status: Optional[PolicyStatus], search: Optional[str], 
  *      limit: int, offset: int, current_user: dict, db: Client) --> List[BylawResponse]
  *        Gets all bylaws with optional filtering (admin or policy_working_group only)
- *    get_approved_bylaws(search: Optional[str], db: Client) --> List[BylawResponse]
+ *    get_approved_bylaws(request: Request, search: Optional[str], db: Client) --> List[BylawResponse]
  *        Gets only approved bylaws (public access)
- *    get_approved_bylaw_by_id(bylaw_id: str, db: Client) --> BylawResponse
+ *    stream_approved_bylaws(search: Optional[str], db: Client) --> StreamingResponse
+ *        Streams approved bylaws as NDJSON, one page at a time (public access)
+ *    get_approved_bylaw_by_id(bylaw_id: str, request: Request, db: Client) --> BylawResponse
  *        Gets a single approved bylaw by ID (public access, only approved bylaws)
  *    approve_bylaw(bylaw_id: str, current_user: dict, db: Client) --> BylawResponse
  *        Approves a bylaw (admin only)
@@ -29,19 +33,112 @@
  * @date: January 2026
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional
-from app.core.database import get_db, get_service_db
+import logging
+import orjson
+import time
+from operator import itemgetter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Any, AsyncIterator, Final, Hashable, List, Optional, Tuple
+from app.core.cache import TTLCache
+from app.core.http_cache import etag_response, make_etag
+from app.core.database import get_db, get_service_db, now_iso, returning, run_query, search_filter
 from app.core.auth import require_admin, require_suggestion_manager
 from app.models.schemas import (
     BylawCreate, BylawUpdate, BylawResponse, PolicyStatus
 )
 from app.core.config import settings
+from postgrest.exceptions import APIError
 from supabase import Client
-from datetime import datetime
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Columns read by convert_bylaw_from_db
+BYLAW_COLS: str = "id,number,title,content,status,created_at,updated_at,created_by,updated_by"
+
+# Status values as plain strings, resolved once instead of per request
+STATUS_APPROVED: Final[str] = PolicyStatus.APPROVED.value
+STATUS_DRAFT: Final[str] = PolicyStatus.DRAFT.value
+
+# SQLSTATE raised by the UNIQUE(number) constraint on a duplicate bylaw number
+UNIQUE_VIOLATION: Final[str] = "23505"
+
+# Pulls the BYLAW_COLS values out of a row as a tuple in a single call
+_bylaw_fields = itemgetter(*BYLAW_COLS.split(","))
+
+# Columns matched as substrings by the search query parameter; number_text is
+# the generated text copy of number (a tuple, as search_filter memoizes on it)
+BYLAW_SEARCH_COLUMNS: Tuple[str, ...] = ("title", "content", "number_text")
+
+# Public approved-bylaw responses as (JSON body, ETag), keyed by ("list", search)
+# and ("id", bylaw_id). Entries are served for APPROVED_CACHE_TTL seconds and kept for
+# APPROVED_STALE_TTL seconds so they can still be served if the database is down.
+APPROVED_CACHE_TTL: Final[int] = 30  # seconds
+APPROVED_STALE_TTL: Final[int] = 3600  # seconds
+_approved_cache: Final[TTLCache] = TTLCache(maxsize=1024, ttl=APPROVED_STALE_TTL)
+
+# Rows fetched per round-trip by the NDJSON stream
+APPROVED_STREAM_PAGE_SIZE: Final[int] = 500
+
+
+def _get_approved_cached(key: Hashable) -> Tuple[Optional[Tuple[bytes, str]], Optional[Tuple[bytes, str]]]:
+    """
+    Look up a cached approved-bylaw response
+
+    Args:
+        key: Cache key, ("list", search) or ("id", bylaw_id)
+
+    Returns:
+        Tuple: (fresh, stale) (JSON body, ETag) pairs - fresh is set while the
+        entry is younger than APPROVED_CACHE_TTL, stale whenever an entry exists
+    """
+    entry = _approved_cache.get(key)
+    if entry is None:
+        return None, None
+    generated_at, value = entry
+    if time.monotonic() - generated_at < APPROVED_CACHE_TTL:
+        return value, value
+    return None, value
+
+
+def _cache_approved(key: Hashable, payload: Any) -> Tuple[bytes, str]:
+    """
+    Serialize an approved-bylaw response and cache it with its ETag
+
+    Args:
+        key: Cache key, ("list", search) or ("id", bylaw_id)
+        payload: Bylaw dict or list of bylaw dicts
+
+    Returns:
+        Tuple[bytes, str]: JSON body and its ETag
+    """
+    body: bytes = orjson.dumps(payload)
+    etag: str = make_etag(body)
+    _approved_cache.set(key, (time.monotonic(), (body, etag)))
+    return body, etag
+
+
+def _approved_response(request: Request, cached: Tuple[bytes, str]) -> Response:
+    """
+    Build a cacheable response, or 304 Not Modified if the client already has it
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        cached: JSON body and ETag
+
+    Returns:
+        Response: 200 with the body, or 304 with no body
+    """
+    body, etag = cached
+    return etag_response(request, body, etag, f"public, max-age={APPROVED_CACHE_TTL}")
+
+
+def invalidate_approved_bylaws() -> None:
+    """Drop every cached approved-bylaw response after a bylaw is written"""
+    _approved_cache.clear()
+
 
 def convert_bylaw_from_db(row: dict) -> dict:
     """
@@ -53,29 +150,26 @@ def convert_bylaw_from_db(row: dict) -> dict:
     - content -> bylaw_content
     
     Args:
-        row: Dictionary containing bylaw data from database
+        row: Dictionary containing bylaw data from database (at least BYLAW_COLS)
         
     Returns:
         dict: Formatted bylaw dictionary with API field names
     """
-    # Get number value - should be INTEGER in DB, but handle both int and string
-    number_value = row.get("number", 0)
-    try:
-        # If it's already an int, use it; otherwise convert
-        bylaw_number = int(number_value) if number_value is not None else 0
-    except (ValueError, TypeError):
-        bylaw_number = 0
+    # Every query selects BYLAW_COLS (or the full row), so all keys are present;
+    # number is INTEGER NOT NULL, so it needs no conversion
+    (bylaw_id, number, title, content, status,
+     created_at, updated_at, created_by, updated_by) = _bylaw_fields(row)
     
     return {
-        "id": str(row.get("id")),
-        "bylaw_number": bylaw_number,  # Map number to bylaw_number (int)
-        "bylaw_title": row.get("title", ""),  # Map title to bylaw_title
-        "bylaw_content": row.get("content", ""),  # Map content to bylaw_content
-        "status": row.get("status", "draft"),
-        "created_at": row.get("created_at"),
-        "updated_at": row.get("updated_at"),
-        "created_by": row.get("created_by"),
-        "updated_by": row.get("updated_by")
+        "id": str(bylaw_id),
+        "bylaw_number": number,  # Map number to bylaw_number (int)
+        "bylaw_title": title or "",  # Map title to bylaw_title
+        "bylaw_content": content or "",  # Map content to bylaw_content
+        "status": status or STATUS_DRAFT,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "created_by": created_by,
+        "updated_by": updated_by
     }
 
 
@@ -103,44 +197,38 @@ async def get_bylaws(
         db: Supabase database client
         
     Returns:
-        List[BylawResponse]: List of bylaw objects matching the filters
+        List[BylawResponse]: One page of bylaw objects matching the filters; the
+            X-Total-Count header holds the number of matches across all pages
+            (0 when offset is past the last match)
         
     Raises:
         HTTPException: 403 if user is not admin or policy_working_group, 500 if database error occurs
     """
     try:
-        query = db.table(settings.BYLAWS_TABLE).select("*")
-        
-        # Apply filters
-        if status:
-            query = query.eq("status", status.value)
-        
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
-        
-        # Order by number
-        query = query.order("number")
-        
-        response = query.execute()
-        
-        # Filter by search term in Python if provided
-        bylaws: List[dict] = [convert_bylaw_from_db(row) for row in response.data]
-        if search:
-            search_lower: str = search.lower()
-            bylaws = [
-                b for b in bylaws
-                if search_lower in b.get("bylaw_title", "").lower()
-                or search_lower in str(b.get("bylaw_number", "")).lower()
-                or search_lower in b.get("bylaw_content", "").lower()
-            ]
-        
-        return bylaws
+        # One get_bylaws RPC applies the filters, search, ordering and pagination
+        # and reports the total number of matches on every row
+        response = await run_query(db.rpc("get_bylaws", {
+            "p_status": status.value if status else None,
+            "p_search": search or None,
+            "p_limit": limit,
+            "p_offset": offset
+        }))
+        rows: List[dict] = response.data or []
+        total: int = rows[0]["total_count"] if rows else 0
+        
+        # Rows come straight from the bylaws table, so skip re-validating them
+        # against response_model and serialize once with orjson
+        return ORJSONResponse(
+            [convert_bylaw_from_db(row) for row in rows],
+            headers={"X-Total-Count": str(total)}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching bylaws: {str(e)}")
 
 
 @router.get("/approved", response_model=List[BylawResponse])
 async def get_approved_bylaws(
+    request: Request,
     search: Optional[str] = Query(None, description="Search query"),
     db: Client = Depends(get_db)
 ) -> List[BylawResponse]:
@@ -148,9 +236,11 @@ async def get_approved_bylaws(
     Get only approved bylaws (public view)
     
     This endpoint is accessible without authentication and returns
-    only bylaws with status "approved".
+    only bylaws with status "approved". Responses carry an ETag, and a
+    matching If-None-Match gets 304 Not Modified.
     
     Args:
+        request: Incoming request (read for If-None-Match)
         search: Optional search query to filter by title, number, or content
         db: Supabase database client
         
@@ -160,32 +250,97 @@ async def get_approved_bylaws(
     Raises:
         HTTPException: 500 if database error occurs
     """
+    cache_key: Tuple[str, str] = ("list", search or "")
+    cached, stale = _get_approved_cached(cache_key)
+    if cached is not None:
+        return _approved_response(request, cached)
+    
     try:
-        query = db.table(settings.BYLAWS_TABLE).select("*").eq("status", "approved")
+        query = db.table(settings.BYLAWS_TABLE).select(BYLAW_COLS).eq("status", STATUS_APPROVED)
+        
+        # Search runs in the database
+        if search:
+            query = query.or_(search_filter(search, BYLAW_SEARCH_COLUMNS))
         
         query = query.order("number")
         
-        response = query.execute()
+        response = await run_query(query)
         
-        # Filter by search term in Python if provided
         bylaws: List[dict] = [convert_bylaw_from_db(row) for row in response.data]
-        if search:
-            search_lower: str = search.lower()
-            bylaws = [
-                b for b in bylaws
-                if search_lower in b.get("bylaw_title", "").lower()
-                or search_lower in str(b.get("bylaw_number", "")).lower()
-                or search_lower in b.get("bylaw_content", "").lower()
-            ]
-        
-        return bylaws
+        return _approved_response(request, _cache_approved(cache_key, bylaws))
     except Exception as e:
+        # Serve the last known list rather than failing while the database is unavailable
+        if stale is not None:
+            logger.warning("Serving stale approved bylaws: %s", e)
+            return _approved_response(request, stale)
         raise HTTPException(status_code=500, detail=f"Error fetching approved bylaws: {str(e)}")
 
 
+async def _fetch_approved_page(db: Client, search: Optional[str], after_number: Optional[int]) -> List[dict]:
+    """
+    Fetch the next page of approved bylaws in number order (keyset pagination)
+
+    Args:
+        db: Supabase database client
+        search: Optional search query
+        after_number: Number of the last bylaw already sent (None for the first page)
+
+    Returns:
+        List[dict]: Up to APPROVED_STREAM_PAGE_SIZE bylaw rows
+    """
+    query = db.table(settings.BYLAWS_TABLE).select(BYLAW_COLS).eq("status", STATUS_APPROVED)
+    if search:
+        query = query.or_(search_filter(search, BYLAW_SEARCH_COLUMNS))
+    if after_number is not None:
+        query = query.gt("number", after_number)
+    response = await run_query(query.order("number").limit(APPROVED_STREAM_PAGE_SIZE))
+    return response.data
+
+
+@router.get("/approved/stream", response_class=StreamingResponse)
+async def stream_approved_bylaws(
+    search: Optional[str] = Query(None, description="Search query"),
+    db: Client = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Stream approved bylaws as newline-delimited JSON (public view)
+    
+    Bylaws are fetched in pages of APPROVED_STREAM_PAGE_SIZE and written out
+    as each page arrives, so memory use does not grow with the number of
+    bylaws. Each line is one bylaw in BylawResponse format.
+    
+    Args:
+        search: Optional search query to filter by title, number, or content
+        db: Supabase database client
+        
+    Returns:
+        StreamingResponse: application/x-ndjson stream of approved bylaws
+        
+    Raises:
+        HTTPException: 500 if the first page cannot be fetched
+    """
+    # Fetch the first page up front so a database error is still a proper 500
+    try:
+        first_page: List[dict] = await _fetch_approved_page(db, search, None)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching approved bylaws: {str(e)}")
+    
+    async def generate() -> AsyncIterator[bytes]:
+        page: List[dict] = first_page
+        while True:
+            for row in page:
+                yield orjson.dumps(convert_bylaw_from_db(row)) + b"\n"
+            if len(page) < APPROVED_STREAM_PAGE_SIZE:
+                return
+            page = await _fetch_approved_page(db, search, page[-1]["number"])
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/{bylaw_id}", response_model=BylawResponse)
 async def get_approved_bylaw_by_id(
     bylaw_id: str,
+    request: Request,
     db: Client = Depends(get_db)
 ) -> BylawResponse:
     """
@@ -193,9 +348,11 @@ async def get_approved_bylaw_by_id(
     
     This endpoint only returns approved bylaws. Public users can access this
     endpoint to view approved bylaws. Non-approved bylaws will return 404.
+    Responses carry an ETag, and a matching If-None-Match gets 304 Not Modified.
     
     Args:
         bylaw_id: UUID of the bylaw to retrieve
+        request: Incoming request (read for If-None-Match)
         db: Supabase database client
         
     Returns:
@@ -204,17 +361,28 @@ async def get_approved_bylaw_by_id(
     Raises:
         HTTPException: 404 if bylaw not found or not approved, 500 if database error occurs
     """
+    cache_key: Tuple[str, str] = ("id", bylaw_id)
+    cached, stale = _get_approved_cached(cache_key)
+    if cached is not None:
+        return _approved_response(request, cached)
+    
     try:
         # Only return approved bylaws
-        response = db.table(settings.BYLAWS_TABLE).select("*").eq("id", bylaw_id).eq("status", "approved").execute()
+        response = await run_query(
+            db.table(settings.BYLAWS_TABLE).select(BYLAW_COLS).eq("id", bylaw_id).eq("status", STATUS_APPROVED)
+        )
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Bylaw not found")
         
-        return convert_bylaw_from_db(response.data[0])
+        bylaw: dict = convert_bylaw_from_db(response.data[0])
+        return _approved_response(request, _cache_approved(cache_key, bylaw))
     except HTTPException:
         raise
     except Exception as e:
+        if stale is not None:
+            logger.warning("Serving stale bylaw %s: %s", bylaw_id, e)
+            return _approved_response(request, stale)
         raise HTTPException(status_code=500, detail=f"Error fetching bylaw: {str(e)}")
 
 
@@ -243,28 +411,33 @@ async def create_bylaw(
         # bylaw_number is already an integer from the schema
         bylaw_number = bylaw.bylaw_number
         
-        # Check if bylaw number already exists
-        existing = db.table(settings.BYLAWS_TABLE).select("*").eq("number", bylaw_number).execute()
-        if existing.data:
-            raise HTTPException(status_code=400, detail="Bylaw number already exists")
+        # One timestamp, so created_at and updated_at match exactly
+        now: str = now_iso()
         
         # Always create bylaws as draft - only admin can approve via approve endpoint
         bylaw_data: dict = {
             "number": bylaw_number,  # Store as INTEGER in DB
             "title": bylaw.bylaw_title,  # Map bylaw_title to title
             "content": bylaw.bylaw_content,  # Map bylaw_content to content
-            "status": "draft",  # Always create as draft
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "status": STATUS_DRAFT,  # Always create as draft
+            "created_at": now,
+            "updated_at": now,
             "created_by": current_user.get("id"),
             "updated_by": current_user.get("id")
         }
         
-        response = db.table(settings.BYLAWS_TABLE).insert(bylaw_data).execute()
+        # UNIQUE(number) rejects duplicates atomically (no separate existence check)
+        try:
+            response = await run_query(db.table(settings.BYLAWS_TABLE).insert(bylaw_data))
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION:
+                raise HTTPException(status_code=400, detail="Bylaw number already exists")
+            raise
         
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to create bylaw")
         
+        invalidate_approved_bylaws()
         return convert_bylaw_from_db(response.data[0])
     except HTTPException:
         raise
@@ -295,14 +468,10 @@ async def update_bylaw(
         BylawResponse: Updated bylaw object (status will be "draft")
         
     Raises:
-        HTTPException: 404 if bylaw not found, 500 if update fails
+        HTTPException: 404 if bylaw not found, 400 if the new bylaw number already exists,
+            500 if update fails
     """
     try:
-        # Get existing bylaw
-        existing = db.table(settings.BYLAWS_TABLE).select("*").eq("id", bylaw_id).execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Bylaw not found")
-        
         # Build update data - map API field names to database column names
         update_data: dict = {}
         if bylaw_update.bylaw_number is not None:
@@ -315,16 +484,24 @@ async def update_bylaw(
         # Always set status to DRAFT when bylaw is updated by policy_working_group or admin
         # Only admin can approve bylaws via the approve endpoint
         # This ensures that any update changes the bylaw back to draft
-        update_data["status"] = "draft"
+        update_data["status"] = STATUS_DRAFT
         
-        update_data["updated_at"] = datetime.utcnow().isoformat()
+        update_data["updated_at"] = now_iso()
         update_data["updated_by"] = current_user.get("id")
         
-        response = db.table(settings.BYLAWS_TABLE).update(update_data).eq("id", bylaw_id).execute()
+        # No row back means no bylaw with this ID (no separate existence check)
+        try:
+            response = await run_query(db.table(settings.BYLAWS_TABLE).update(update_data).eq("id", bylaw_id))
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION:
+                raise HTTPException(status_code=400, detail="Bylaw number already exists")
+            raise
         
         if not response.data:
-            raise HTTPException(status_code=500, detail="Failed to update bylaw")
+            raise HTTPException(status_code=404, detail="Bylaw not found")
         
+        # The bylaw is back in draft, so it must drop out of the public responses
+        invalidate_approved_bylaws()
         return convert_bylaw_from_db(response.data[0])
     except HTTPException:
         raise
@@ -356,33 +533,32 @@ async def approve_bylaw(
         HTTPException: 404 if bylaw not found, 400 if already approved, 500 if update fails
     """
     try:
-        # Get existing bylaw
-        existing = db.table(settings.BYLAWS_TABLE).select("*").eq("id", bylaw_id).execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Bylaw not found")
-        
-        existing_bylaw = existing.data[0]
-        current_status = existing_bylaw.get("status", "draft")
-        
-        # Check if already approved
-        if current_status == PolicyStatus.APPROVED.value:
-            raise HTTPException(
-                status_code=400,
-                detail="Bylaw is already approved"
-            )
-        
-        # Update status to approved
+        # Update status to approved - only if not already approved, so the check
+        # and the write happen atomically in one statement
         update_data = {
-            "status": PolicyStatus.APPROVED.value,
-            "updated_at": datetime.utcnow().isoformat(),
+            "status": STATUS_APPROVED,
+            "updated_at": now_iso(),
             "updated_by": current_user.get("id")
         }
         
-        response = db.table(settings.BYLAWS_TABLE).update(update_data).eq("id", bylaw_id).execute()
+        response = await run_query(
+            db.table(settings.BYLAWS_TABLE)
+            .update(update_data)
+            .eq("id", bylaw_id)
+            .neq("status", STATUS_APPROVED)
+        )
         
         if not response.data:
-            raise HTTPException(status_code=500, detail="Failed to approve bylaw")
+            # Nothing updated - find out whether the bylaw is missing or already approved
+            existing = await run_query(db.table(settings.BYLAWS_TABLE).select("id").eq("id", bylaw_id).limit(1))
+            if not existing.data:
+                raise HTTPException(status_code=404, detail="Bylaw not found")
+            raise HTTPException(
+                status_code=400,
+                detail="Bylaw is already approved"
+            )
         
+        invalidate_approved_bylaws()
         return convert_bylaw_from_db(response.data[0])
     except HTTPException:
         raise
@@ -411,14 +587,13 @@ async def delete_bylaw(
         HTTPException: 404 if bylaw not found, 500 if deletion fails
     """
     try:
-        # Check if bylaw exists
-        existing = db.table(settings.BYLAWS_TABLE).select("*").eq("id", bylaw_id).execute()
-        if not existing.data:
+        # Delete bylaw - no row back means it did not exist. Only the id is
+        # returned (DELETE ... RETURNING id), not the whole bylaw body
+        response = await run_query(returning(db.table(settings.BYLAWS_TABLE).delete().eq("id", bylaw_id), "id"))
+        if not response.data:
             raise HTTPException(status_code=404, detail="Bylaw not found")
         
-        # Delete bylaw
-        db.table(settings.BYLAWS_TABLE).delete().eq("id", bylaw_id).execute()
-        
+        invalidate_approved_bylaws()
         return None
     except HTTPException:
         raise
@@ -5,17 +5,21 @@
  * ASA Policy Management System. Policies can be created, read, updated,
  * and deleted by admins, while public users can only view approved policies.
  *
+ * Public Classes:
+ *    PolicyListParams
+ *        Filter and pagination query parameters of the admin policy list
+ *
  * Public Functions:
  *    convert_policy_from_db(row: dict) --> dict
  *        Converts a database row to policy response format
- *    get_policies(status: Optional[PolicyStatus], section: Optional[str], 
- *      search: Optional[str], limit: int, offset: int, current_user: dict, 
- *      db: Client) --> List[PolicyResponse]
+ *    invalidate_approved_policies() --> None
+ *        Drops cached approved-policy responses after a write
+ *    get_policies(params: PolicyListParams, current_user: dict, db: Client) --> List[PolicyResponse]
  *        Gets all policies with optional filtering (admin or policy_working_group only)
- *    get_approved_policies(section: Optional[str], search: Optional[str], 
+ *    get_approved_policies(request: Request, section: Optional[str], search: Optional[str], 
  *      db: Client) --> List[PolicyResponse]
  *        Gets only approved policies (public access)
- *    get_approved_policy_by_id(policy_id: str, db: Client) --> PolicyResponse
+ *    get_approved_policy_by_id(policy_id: str, request: Request, db: Client) --> PolicyResponse
  *        Gets a single approved policy by ID (public access, only approved policies)
  *    create_policy(policy: PolicyCreate, current_user: dict, db: Client) --> PolicyResponse
  *        Creates a new policy (admin only)
@@ -24,27 +28,86 @@
  *        Updates an existing policy (admin only)
  *    delete_policy(policy_id: str, current_user: dict, db: Client) --> None
  *        Deletes a policy (admin only)
- *    get_policy_versions(policy_id: str, current_user: dict, db: Client) --> List[PolicyResponse]
+ *    get_policy_versions(policy_id: str, limit: int, before_version: Optional[int],
+ *      current_user: dict, db: Client) --> List[PolicyResponse]
  *        Gets version history for a policy (admin only)
  *
  * @author: ASA Policy App Development Team
  * @date: January 2026
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional
-from app.core.database import get_db, get_service_db
+import asyncio
+import orjson
+from dataclasses import dataclass
+from operator import itemgetter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Final, List, Optional, Tuple
+from app.core.cache import TTLCache
+from app.core.http_cache import etag_response, make_etag
+from app.core.database import get_db, get_service_db, now_iso, returning, run_query
 from app.core.auth import require_admin, get_optional_user, require_suggestion_manager
 from app.models.schemas import (
     PolicyCreate, PolicyUpdate, PolicyResponse, PolicyStatus, PolicySearchParams,
-    PolicyReviewCreate, PolicyReviewResponse, PolicyReviewsResponse, ReviewStatus
+    PolicyReviewCreate, PolicyReviewsResponse
 )
 from app.core.config import settings
+from postgrest.exceptions import APIError
 from supabase import Client
-from datetime import datetime
 
 router = APIRouter()
 
+# SQLSTATE raised by the UNIQUE(policy_id) constraint on a duplicate policy ID
+UNIQUE_VIOLATION: Final[str] = "23505"
+
+# Pulls the columns convert_policy_from_db needs out of a row in a single call
+_policy_fields = itemgetter(
+    "id", "policy_id", "name", "section", "content", "status",
+    "created_at", "updated_at", "created_by", "updated_by"
+)
+
+# Public approved-policy responses as (JSON body, ETag), keyed by ("list", section, search)
+# and ("id", policy_id). Cleared on every policy write; other workers pick up
+# writes within APPROVED_CACHE_TTL.
+APPROVED_CACHE_TTL: Final[int] = 60  # seconds
+_approved_cache: Final[TTLCache] = TTLCache(maxsize=512, ttl=APPROVED_CACHE_TTL)
+
+
+def invalidate_approved_policies() -> None:
+    """Drop every cached approved-policy response after a policy is written"""
+    _approved_cache.clear()
+
+
+def _cache_approved(key: Tuple[str, ...], body: bytes) -> Tuple[bytes, str]:
+    """
+    Cache a serialized approved-policy response with its ETag
+
+    Args:
+        key: Cache key, ("list", section, search) or ("id", policy_id)
+        body: Serialized JSON body
+
+    Returns:
+        Tuple[bytes, str]: JSON body and its ETag
+    """
+    cached: Tuple[bytes, str] = (body, make_etag(body))
+    _approved_cache.set(key, cached)
+    return cached
+
+
+def _approved_response(request: Request, cached: Tuple[bytes, str]) -> Response:
+    """
+    Build a cacheable response, or 304 Not Modified if the client already has it
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        cached: JSON body and ETag
+
+    Returns:
+        Response: 200 with the body, or 304 with no body
+    """
+    body, etag = cached
+    return etag_response(request, body, etag, f"public, max-age={APPROVED_CACHE_TTL}")
+
 
 def convert_policy_from_db(row: dict) -> dict:
     """
@@ -55,33 +118,56 @@ def convert_policy_from_db(row: dict) -> dict:
     - content -> policy_content
     
     Args:
-        row: Dictionary containing policy data from database
+        row: Dictionary containing a full policies row from database
         
     Returns:
         dict: Formatted policy dictionary with API field names
     """
+    # Every query returns whole policies rows, so all keys are present
+    (policy_uuid, policy_id, name, section, content, status,
+     created_at, updated_at, created_by, updated_by) = _policy_fields(row)
+    
     return {
-        "id": str(row.get("id")),
-        "policy_id": row.get("policy_id", ""),
-        "policy_name": row.get("name", ""),  # Map name to policy_name
-        "section": row.get("section", "1"),
-        "policy_content": row.get("content", ""),  # Map content to policy_content
-        "status": row.get("status", "draft"),
-        "created_at": row.get("created_at"),
-        "updated_at": row.get("updated_at"),
-        "created_by": row.get("created_by"),
-        "updated_by": row.get("updated_by")
+        "id": str(policy_uuid),
+        "policy_id": policy_id or "",
+        "policy_name": name or "",  # Map name to policy_name
+        "section": section or "1",
+        "policy_content": content or "",  # Map content to policy_content
+        "status": status or "draft",
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "created_by": created_by,
+        "updated_by": updated_by
     }
 
 
+@dataclass(frozen=True)
+class PolicyListParams:
+    """
+    Filter and pagination query parameters of the admin policy list
+
+    Used as `params: PolicyListParams = Depends()`, so FastAPI reads each field
+    as a query parameter with the constraints below.
+
+    Attributes:
+        status (Optional[PolicyStatus]): Filter by status
+        section (Optional[str]): Filter by section
+        search (Optional[str]): Full-text search query
+        policy_id (Optional[str]): Filter by specific policy_id (e.g., "1.1.1")
+        limit (int): Maximum number of results to return (1-100)
+        offset (int): Number of results to skip for pagination
+    """
+    status: Optional[PolicyStatus] = Query(None, description="Filter by status")
+    section: Optional[str] = Query(None, description="Filter by section")
+    search: Optional[str] = Query(None, description="Search query")
+    policy_id: Optional[str] = Query(None, description="Filter by specific policy_id (e.g., '1.1.1')")
+    limit: int = Query(50, ge=1, le=100)
+    offset: int = Query(0, ge=0)
+
+
 @router.get("/", response_model=List[PolicyResponse])
 async def get_policies(
-    status: Optional[PolicyStatus] = Query(None, description="Filter by status"),
-    section: Optional[str] = Query(None, description="Filter by section"),
-    search: Optional[str] = Query(None, description="Search query"),
-    policy_id: Optional[str] = Query(None, description="Filter by specific policy_id (e.g., '1.1.1')"),
-    limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    params: PolicyListParams = Depends(),
     current_user: dict = Depends(require_suggestion_manager),  # Admin or policy_working_group only
     db: Client = Depends(get_service_db)
 ) -> List[PolicyResponse]:
@@ -92,57 +178,71 @@ async def get_policies(
     Public users should use the /approved endpoint to view only approved policies.
     
     Args:
-        status: Optional status filter (draft, approved, archived, under_review)
-        section: Optional section filter (1, 2, or 3)
-        search: Optional search query to filter by name, policy_id, or content
-        policy_id: Optional policy_id filter to get a specific policy by ID (e.g., "1.1.1")
-        limit: Maximum number of results to return (1-100)
-        offset: Number of results to skip for pagination
+        params: Filters and pagination - status, section, search (full-text over
+            name, policy_id, and content; a policy_id prefix such as "1.2" also
+            matches), policy_id, limit (1-100) and offset
         current_user: Current authenticated user (admin or policy_working_group)
         db: Supabase database client
         
     Returns:
-        List[PolicyResponse]: List of policy objects matching the filters
+        List[PolicyResponse]: One page of policy objects matching the filters; the
+            X-Total-Count header holds the number of matches across all pages
         
     Raises:
         HTTPException: 403 if user is not admin or policy_working_group, 500 if database error occurs
     """
+    status: Optional[PolicyStatus] = params.status
+    search: Optional[str] = params.search
     try:
-        query = db.table(settings.POLICIES_TABLE).select("*")
-        
-        # Apply filters
-        if status:
-            query = query.eq("status", status.value)
-        if section:
-            query = query.eq("section", section)
-        if policy_id:
-            query = query.eq("policy_id", policy_id)
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
-        
-        # Order by section and policy_id
-        query = query.order("section").order("policy_id")
+        if search:
+            # Full-text search runs in the database (GIN index), with the same
+            # filters, ordering and pagination applied there; every row carries
+            # the total number of matches
+            query = db.rpc("search_policies", {
+                "q": search,
+                "p_status": status.value if status else None,
+                "p_section": params.section,
+                "p_policy_id": params.policy_id,
+                "p_limit": params.limit,
+                "p_offset": params.offset
+            })
+        else:
+            # count="exact" returns the total number of matches alongside the page
+            query = db.table(settings.POLICIES_TABLE).select("*", count="exact")
+            
+            # Apply filters
+            if status:
+                query = query.eq("status", status.value)
+            if params.section:
+                query = query.eq("section", params.section)
+            if params.policy_id:
+                query = query.eq("policy_id", params.policy_id)
+            # Apply pagination
+            query = query.range(params.offset, params.offset + params.limit - 1)
+            
+            # Order by section and policy_id
+            query = query.order("section").order("policy_id")
         
-        response = query.execute()
+        result = await run_query(query)
         
-        # Filter by search term in Python if provided (Supabase Python client has limited OR support)
-        policies: List[dict] = [convert_policy_from_db(row) for row in response.data]
         if search:
-            search_lower: str = search.lower()
-            policies = [
-                p for p in policies
-                if search_lower in p.get("policy_name", "").lower()
-                or search_lower in p.get("policy_id", "").lower()
-                or search_lower in p.get("policy_content", "").lower()
-            ]
-        
-        return policies
+            total: int = result.data[0]["total_count"] if result.data else 0
+        else:
+            total = result.count or 0
+        
+        # Rows come straight from the policies table, so skip re-validating them
+        # against response_model and serialize once with orjson
+        return ORJSONResponse(
+            [convert_policy_from_db(row) for row in result.data],
+            headers={"X-Total-Count": str(total)}
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching policies: {str(e)}")
 
 
 @router.get("/approved", response_model=List[PolicyResponse])
 async def get_approved_policies(
+    request: Request,
     section: Optional[str] = Query(None, description="Filter by section"),
     search: Optional[str] = Query(None, description="Search query"),
     db: Client = Depends(get_db)
@@ -151,11 +251,14 @@ async def get_approved_policies(
     Get only approved policies (public view)
     
     This endpoint is accessible without authentication and returns
-    only policies with status "approved".
+    only policies with status "approved". Responses carry an ETag, and a
+    matching If-None-Match gets 304 Not Modified.
     
     Args:
+        request: Incoming request (read for If-None-Match)
         section: Optional section filter (1, 2, or 3)
-        search: Optional search query to filter by name, policy_id, or content
+        search: Optional full-text search over name, policy_id, and content
+            (a policy_id prefix such as "1.2" also matches)
         db: Supabase database client
         
     Returns:
@@ -164,28 +267,29 @@ async def get_approved_policies(
     Raises:
         HTTPException: 500 if database error occurs
     """
+    cache_key: Tuple[str, str, str] = ("list", section or "", search or "")
+    cached: Optional[Tuple[bytes, str]] = _approved_cache.get(cache_key)
+    if cached is not None:
+        return _approved_response(request, cached)
+    
     try:
-        query = db.table(settings.POLICIES_TABLE).select("*").eq("status", "approved")
-        
-        if section:
-            query = query.eq("section", section)
-        
-        query = query.order("section").order("policy_id")
+        if search:
+            # Full-text search runs in the database (GIN index)
+            query = db.rpc("search_policies", {"q": search, "p_status": "approved", "p_section": section})
+        else:
+            query = db.table(settings.POLICIES_TABLE).select("*").eq("status", "approved")
+            
+            if section:
+                query = query.eq("section", section)
+            
+            query = query.order("section").order("policy_id")
         
-        response = query.execute()
+        response = await run_query(query)
         
-        # Filter by search term in Python if provided
-        policies: List[dict] = [convert_policy_from_db(row) for row in response.data]
-        if search:
-            search_lower: str = search.lower()
-            policies = [
-                p for p in policies
-                if search_lower in p.get("name", "").lower()
-                or search_lower in p.get("policy_id", "").lower()
-                or search_lower in p.get("content", "").lower()
-            ]
-        
-        return policies
+        # Rows come straight from the policies table, so skip re-validating them
+        # against response_model; serialize once with orjson and cache the bytes
+        body: bytes = orjson.dumps([convert_policy_from_db(row) for row in response.data])
+        return _approved_response(request, _cache_approved(cache_key, body))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching approved policies: {str(e)}")
 
@@ -193,6 +297,7 @@ async def get_approved_policies(
 @router.get("/{policy_id}", response_model=PolicyResponse)
 async def get_approved_policy_by_id(
     policy_id: str,
+    request: Request,
     db: Client = Depends(get_db)
 ) -> PolicyResponse:
     """
@@ -200,9 +305,11 @@ async def get_approved_policy_by_id(
     
     This endpoint only returns approved policies. Public users can access this
     endpoint to view approved policies. Non-approved policies will return 404.
+    Responses carry an ETag, and a matching If-None-Match gets 304 Not Modified.
     
     Args:
         policy_id: Policy identifier (e.g., "1.1.1"), not UUID
+        request: Incoming request (read for If-None-Match)
         db: Supabase database client
         
     Returns:
@@ -211,15 +318,23 @@ async def get_approved_policy_by_id(
     Raises:
         HTTPException: 404 if policy not found or not approved, 500 if database error occurs
     """
+    cache_key: Tuple[str, str] = ("id", policy_id)
+    cached: Optional[Tuple[bytes, str]] = _approved_cache.get(cache_key)
+    if cached is not None:
+        return _approved_response(request, cached)
+    
     try:
         # Look up by policy_id (TEXT field like "1.1.1"), not UUID id
         # Only return approved policies
-        response = db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy_id).eq("status", "approved").execute()
+        response = await run_query(
+            db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy_id).eq("status", "approved")
+        )
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Policy not found")
         
-        return convert_policy_from_db(response.data[0])
+        body: bytes = orjson.dumps(convert_policy_from_db(response.data[0]))
+        return _approved_response(request, _cache_approved(cache_key, body))
     except HTTPException:
         raise
     except Exception as e:
@@ -250,10 +365,8 @@ async def create_policy(
         HTTPException: 400 if policy_id already exists, 500 if creation fails
     """
     try:
-        # Check if policy_id already exists
-        existing = db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy.policy_id).execute()
-        if existing.data:
-            raise HTTPException(status_code=400, detail="Policy ID already exists")
+        # One timestamp, so created_at and updated_at match exactly
+        now: str = now_iso()
         
         # Map API field names to database column names
         # Force status to DRAFT - only admin can approve via approve endpoint
@@ -263,17 +376,24 @@ async def create_policy(
             "section": policy.section,
             "content": policy.policy_content,  # Map policy_content to content
             "status": PolicyStatus.DRAFT.value,  # Always create as draft
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "created_by": current_user.get("id"),
             "updated_by": current_user.get("id")
         }
         
-        response = db.table(settings.POLICIES_TABLE).insert(policy_data).execute()
+        # UNIQUE(policy_id) rejects duplicates atomically (no separate existence check)
+        try:
+            response = await run_query(db.table(settings.POLICIES_TABLE).insert(policy_data))
+        except APIError as e:
+            if e.code == UNIQUE_VIOLATION:
+                raise HTTPException(status_code=400, detail="Policy ID already exists")
+            raise
         
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to create policy")
         
+        invalidate_approved_policies()
         return convert_policy_from_db(response.data[0])
     except HTTPException:
         raise
@@ -308,72 +428,24 @@ async def update_policy(
         HTTPException: 404 if policy not found, 500 if update fails
     """
     try:
-        # Get existing policy (before update) - look up by policy_id (TEXT), not UUID
-        existing = db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy_id).execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Policy not found")
-        
-        existing_policy = existing.data[0]
-        # Get the UUID id for version history and update operations
-        policy_uuid = existing_policy.get("id")
-        
-        # Build update data - map API field names to database column names
-        update_data: dict = {}
-        if policy_update.policy_name is not None:
-            update_data["name"] = policy_update.policy_name  # Map policy_name to name
-        if policy_update.section is not None:
-            update_data["section"] = policy_update.section
-        if policy_update.policy_content is not None:
-            update_data["content"] = policy_update.policy_content  # Map policy_content to content
-        
-        # Always set status to DRAFT when policy is updated by policy_working_group or admin
-        # Only admin can approve policies via the approve endpoint
-        # This ensures that any update (even if just status) changes the policy back to draft
-        update_data["status"] = PolicyStatus.DRAFT.value
-        
-        # Only save version if something actually changed
-        has_changes = (
-            (policy_update.policy_name is not None and policy_update.policy_name != existing_policy.get("name")) or
-            (policy_update.section is not None and policy_update.section != existing_policy.get("section")) or
-            (policy_update.policy_content is not None and policy_update.policy_content != existing_policy.get("content")) or
-            ("status" in update_data and update_data["status"] != existing_policy.get("status"))
-        )
-        
-        if has_changes:
-            # Save current version to policy_versions table before updating
-            # policy_versions.policy_id references policies.id (UUID), not policy_id (TEXT)
-            versions_response = db.table(settings.POLICY_VERSIONS_TABLE).select("version_number").eq("policy_id", policy_uuid).order("version_number", desc=True).limit(1).execute()
-            
-            next_version: int = 1
-            if versions_response.data and len(versions_response.data) > 0:
-                next_version = int(versions_response.data[0].get("version_number", 0)) + 1
-            
-            # Create version record with the current (pre-update) state
-            # Use UUID for the foreign key relationship
-            version_data: dict = {
-                "policy_id": policy_uuid,  # UUID for foreign key relationship
-                "version_number": next_version,
-                "name": existing_policy.get("name", ""),
-                "section": existing_policy.get("section", ""),
-                "content": existing_policy.get("content", ""),
-                "status": existing_policy.get("status", "draft"),
-                "created_at": datetime.utcnow().isoformat(),
-                "created_by": current_user.get("id")
-            }
-            
-            # Insert version history
-            db.table(settings.POLICY_VERSIONS_TABLE).insert(version_data).execute()
-        
-        # Add metadata to update
-        update_data["updated_at"] = datetime.utcnow().isoformat()
-        update_data["updated_by"] = current_user.get("id")
-        
-        # Update by policy_id (TEXT field), not UUID
-        response = db.table(settings.POLICIES_TABLE).update(update_data).eq("policy_id", policy_id).execute()
-        
+        # One RPC locks the policy, saves the pre-update state to policy_versions
+        # (only if something changes) and applies the update, in one transaction.
+        # Fields left as None are not changed; the status always goes back to
+        # draft - only admin can approve policies via the approve endpoint.
+        response = await run_query(db.rpc("update_policy_with_version", {
+            "p_policy_id": policy_id,  # Policy identifier (TEXT), not UUID
+            "p_name": policy_update.policy_name,  # Map policy_name to name
+            "p_section": policy_update.section,
+            "p_content": policy_update.policy_content,  # Map policy_content to content
+            "p_user": current_user.get("id")
+        }))
+        
+        # No row back means no policy with this policy_id
         if not response.data:
-            raise HTTPException(status_code=500, detail="Failed to update policy")
+            raise HTTPException(status_code=404, detail="Policy not found")
         
+        # The policy is back in draft, so it must drop out of the public responses
+        invalidate_approved_policies()
         return convert_policy_from_db(response.data[0])
     except HTTPException:
         raise
@@ -402,14 +474,13 @@ async def delete_policy(
         HTTPException: 404 if policy not found, 500 if deletion fails
     """
     try:
-        # Check if policy exists - look up by policy_id (TEXT), not UUID
-        existing = db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy_id).execute()
-        if not existing.data:
+        # Delete policy by policy_id (TEXT field), not UUID - no row back means it
+        # did not exist. Only the id is returned, not the whole policy body
+        response = await run_query(returning(db.table(settings.POLICIES_TABLE).delete().eq("policy_id", policy_id), "id"))
+        if not response.data:
             raise HTTPException(status_code=404, detail="Policy not found")
         
-        # Delete policy by policy_id (TEXT field)
-        db.table(settings.POLICIES_TABLE).delete().eq("policy_id", policy_id).execute()
-        
+        invalidate_approved_policies()
         return None
     except HTTPException:
         raise
@@ -417,20 +488,21 @@ async def delete_policy(
         raise HTTPException(status_code=500, detail=f"Error deleting policy: {str(e)}")
 
 
-def convert_version_from_db(row: dict, policy_uuid: str) -> dict:
+def convert_version_from_db(row: dict, policy_uuid: str, policy_identifier: str) -> dict:
     """
     Convert policy version database row to policy response format
     
     Args:
         row: Dictionary containing version data from database
         policy_uuid: The policy UUID (for id field)
+        policy_identifier: The policy's TEXT identifier (e.g., "1.1.1")
         
     Returns:
         dict: Formatted policy dictionary with API field names
     """
     return {
         "id": policy_uuid,  # Use the policy UUID, not version ID
-        "policy_id": "",  # Will be set by caller with the actual policy_id (TEXT)
+        "policy_id": policy_identifier,  # Use the policy's TEXT identifier
         "policy_name": row.get("name", ""),  # Map name to policy_name
         "section": row.get("section", "1"),
         "policy_content": row.get("content", ""),  # Map content to policy_content
@@ -466,33 +538,35 @@ async def approve_policy(
         HTTPException: 404 if policy not found, 400 if already approved, 500 if update fails
     """
     try:
-        # Get existing policy - look up by policy_id (TEXT), not UUID
-        existing = db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy_id).execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Policy not found")
-        
-        existing_policy = existing.data[0]
-        current_status = existing_policy.get("status", "draft")
-        
-        # Check if already approved
-        if current_status == PolicyStatus.APPROVED.value:
-            raise HTTPException(
-                status_code=400,
-                detail="Policy is already approved"
-            )
-        
-        # Update status to approved
+        # Update status to approved - only if not already approved, so the check
+        # and the write happen atomically in one statement. Look up by
+        # policy_id (TEXT), not UUID
         update_data = {
             "status": PolicyStatus.APPROVED.value,
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": now_iso(),
             "updated_by": current_user.get("id")
         }
         
-        response = db.table(settings.POLICIES_TABLE).update(update_data).eq("policy_id", policy_id).execute()
+        response = await run_query(
+            db.table(settings.POLICIES_TABLE)
+            .update(update_data)
+            .eq("policy_id", policy_id)
+            .neq("status", PolicyStatus.APPROVED.value)
+        )
         
         if not response.data:
-            raise HTTPException(status_code=500, detail="Failed to approve policy")
+            # Nothing updated - find out whether the policy is missing or already approved
+            existing = await run_query(
+                db.table(settings.POLICIES_TABLE).select("id").eq("policy_id", policy_id).limit(1)
+            )
+            if not existing.data:
+                raise HTTPException(status_code=404, detail="Policy not found")
+            raise HTTPException(
+                status_code=400,
+                detail="Policy is already approved"
+            )
         
+        invalidate_approved_policies()
         return convert_policy_from_db(response.data[0])
     except HTTPException:
         raise
@@ -503,18 +577,25 @@ async def approve_policy(
 @router.get("/{policy_id}/versions", response_model=List[PolicyResponse])
 async def get_policy_versions(
     policy_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    before_version: Optional[int] = Query(None, ge=1, description="Return versions older than this version number"),
     current_user: dict = Depends(require_admin),  # Require admin role
     db: Client = Depends(get_service_db)  # Admin only
 ) -> List[PolicyResponse]:
     """
     Get version history for a policy (admin only)
     
-    Returns all previous versions of the policy, ordered by version number
-    (newest first). The current version is not included - use GET /policies/{policy_id}
-    to get the current version.
+    Returns previous versions of the policy, ordered by version number
+    (newest first), one page at a time. The current version is not included -
+    use GET /policies/{policy_id} to get the current version.
+    
+    When more versions remain, the X-Next-Before-Version header holds the
+    before_version value that fetches the next page.
     
     Args:
         policy_id: Policy identifier (e.g., "1.1.1"), not UUID
+        limit: Maximum number of versions to return (1-200)
+        before_version: Only return versions older than this version number
         current_user: Current authenticated admin user
         db: Supabase database client with service role
         
@@ -525,28 +606,34 @@ async def get_policy_versions(
         HTTPException: 404 if policy not found, 500 if database error occurs
     """
     try:
-        # Verify policy exists - look up by policy_id (TEXT), not UUID
-        policy_response = db.table(settings.POLICIES_TABLE).select("*").eq("policy_id", policy_id).execute()
-        if not policy_response.data:
+        # One RPC looks up the policy by policy_id (TEXT) and joins its versions
+        # (policy_versions.policy_id references policies.id UUID). A policy with
+        # no versions in range comes back as one row with a NULL version_number.
+        # Keyset pagination: one extra row tells whether another page follows
+        response = await run_query(db.rpc("get_policy_versions", {
+            "p_policy_id": policy_id,
+            "p_limit": limit + 1,
+            "p_before_version": before_version
+        }))
+        if not response.data:
             raise HTTPException(status_code=404, detail="Policy not found")
         
-        # Get the policy data
-        policy_data = policy_response.data[0]
-        policy_uuid = policy_data.get("id")  # UUID for foreign key lookup
-        policy_identifier = policy_data.get("policy_id", "")  # TEXT identifier like "1.1.1"
-        
-        # Get all versions for this policy using UUID (policy_versions.policy_id references policies.id UUID)
-        versions_response = db.table(settings.POLICY_VERSIONS_TABLE).select("*").eq("policy_id", policy_uuid).order("version_number", desc=True).execute()
-        
-        # Convert versions to response format
-        versions = []
-        for version_row in versions_response.data:
-            # Add the policy_id identifier to each version
-            version_dict = convert_version_from_db(version_row, policy_uuid)
-            version_dict["policy_id"] = policy_identifier  # Use the policy's TEXT identifier
-            versions.append(version_dict)
-        
-        return versions
+        policy_uuid: str = str(response.data[0]["policy_uuid"])
+        policy_identifier: str = response.data[0]["policy_identifier"]  # TEXT identifier like "1.1.1"
+        
+        # A lone row with a NULL version_number means no versions in range
+        rows: List[dict] = response.data if response.data[0]["version_number"] is not None else []
+        headers: dict = {}
+        if len(rows) > limit:
+            rows = rows[:limit]
+            headers["X-Next-Before-Version"] = str(rows[-1]["version_number"])
+        
+        # Convert versions to response format in one pass. Built from our own
+        # rows - skip re-validation against response_model
+        return ORJSONResponse(
+            [convert_version_from_db(row, policy_uuid, policy_identifier) for row in rows],
+            headers=headers
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -583,41 +670,40 @@ async def submit_policy_review(
         if not current_user:
             raise HTTPException(status_code=401, detail="Authentication required")
         
+        # Verify policy exists - runs concurrently with the email lookup below
+        policy_query = db.table(settings.POLICIES_TABLE).select("id").eq("policy_id", policy_id).limit(1)
+        
         # Get user email from current_user
         user_email = current_user.get("email")
-        if not user_email:
+        user_id = current_user.get("id")
+        if not user_email and user_id:
             # Try to get email from users table
-            user_id = current_user.get("id")
-            if user_id:
-                user_response = db.table(settings.USERS_TABLE).select("email").eq("id", user_id).execute()
-                if user_response.data:
-                    user_email = user_response.data[0].get("email")
+            policy_check, user_response = await asyncio.gather(
+                run_query(policy_query),
+                run_query(db.table(settings.USERS_TABLE).select("email").eq("id", user_id).limit(1))
+            )
+            if user_response.data:
+                user_email = user_response.data[0].get("email")
+        elif user_email:
+            policy_check = await run_query(policy_query)
         
         if not user_email:
             raise HTTPException(status_code=400, detail="User email not found")
         
-        # Verify policy exists
-        policy_check = db.table(settings.POLICIES_TABLE).select("id").eq("policy_id", policy_id).execute()
         if not policy_check.data:
             raise HTTPException(status_code=404, detail="Policy not found")
         
-        # Check if review already exists for this user and policy
-        existing_review = db.table(settings.POLICY_REVIEWS_TABLE).select("*").eq("policy_id", policy_id).eq("user_email", user_email).execute()
-        
+        # Insert the review, or update it if this user already reviewed the policy.
+        # UNIQUE(policy_id, user_email) makes this one atomic statement; created_at
+        # is left to its column default, so an update keeps the original value
         review_data = {
             "policy_id": policy_id,
             "user_email": user_email,
             "review_status": review.review_status.value,
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": now_iso()
         }
         
-        if existing_review.data:
-            # Update existing review
-            db.table(settings.POLICY_REVIEWS_TABLE).update(review_data).eq("policy_id", policy_id).eq("user_email", user_email).execute()
-        else:
-            # Create new review
-            review_data["created_at"] = datetime.utcnow().isoformat()
-            db.table(settings.POLICY_REVIEWS_TABLE).insert(review_data).execute()
+        await run_query(db.table(settings.POLICY_REVIEWS_TABLE).upsert(review_data, on_conflict="policy_id,user_email"))
         
         return {"message": "Review submitted successfully"}
     except HTTPException:
@@ -649,36 +735,27 @@ async def get_policy_reviews(
         HTTPException: 404 if policy not found, 500 if database error occurs
     """
     try:
-        # Verify policy exists
-        policy_check = db.table(settings.POLICIES_TABLE).select("id").eq("policy_id", policy_id).execute()
-        if not policy_check.data:
+        # One RPC checks the policy exists and groups its reviewers' emails by
+        # review status in the database (always returns exactly one row)
+        response = await run_query(db.rpc("policy_reviews_summary", {"p": policy_id}))
+        summary: dict = response.data[0]
+        if not summary["policy_exists"]:
             raise HTTPException(status_code=404, detail="Policy not found")
         
-        # Get all reviews for this policy
-        reviews_response = db.table(settings.POLICY_REVIEWS_TABLE).select("*").eq("policy_id", policy_id).execute()
-        
-        # Separate reviews by status
-        confirmed_emails = []
-        needs_work_emails = []
-        
-        for review in reviews_response.data:
-            review_status = review.get("review_status")
-            user_email = review.get("user_email")
-            if review_status == ReviewStatus.CONFIRM.value:
-                confirmed_emails.append(user_email)
-            elif review_status == ReviewStatus.NEEDS_WORK.value:
-                needs_work_emails.append(user_email)
-        
-        return PolicyReviewsResponse(
-            confirmed=PolicyReviewResponse(
-                numberOfPeople=len(confirmed_emails),
-                people=confirmed_emails
-            ),
-            needs_work=PolicyReviewResponse(
-                numberOfPeople=len(needs_work_emails),
-                people=needs_work_emails
-            )
-        )
+        confirmed_emails: List[str] = summary["confirmed"]
+        needs_work_emails: List[str] = summary["needs_work"]
+        
+        # Plain data in the PolicyReviewsResponse shape, serialized once with orjson
+        return ORJSONResponse({
+            "confirmed": {
+                "numberOfPeople": len(confirmed_emails),
+                "people": confirmed_emails
+            },
+            "needs_work": {
+                "numberOfPeople": len(needs_work_emails),
+                "people": needs_work_emails
+            }
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -707,17 +784,9 @@ async def reset_all_policy_reviews(
         HTTPException: 500 if deletion fails
     """
     try:
-        # Get count of all reviews before deletion
-        reviews_response = db.table(settings.POLICY_REVIEWS_TABLE).select("id").execute()
-        review_count = len(reviews_response.data) if reviews_response.data else 0
-        
-        # Delete all reviews from the table
-        # Using service role, we can delete all rows by selecting all and deleting
-        if review_count > 0:
-            # Get all review IDs and delete them
-            all_review_ids = [review.get("id") for review in reviews_response.data]
-            # Delete in batches if needed, or all at once
-            db.table(settings.POLICY_REVIEWS_TABLE).delete().in_("id", all_review_ids).execute()
+        # Delete every review in one statement; the RPC returns how many were deleted
+        response = await run_query(db.rpc("reset_all_policy_reviews", {}))
+        review_count: int = response.data[0]["deleted_count"]
         
         return {
             "message": "All reviews for all policies have been reset",
@@ -10,13 +10,13 @@
  * @date: April 2026
 """
 
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List
-from datetime import datetime
 
 from supabase import Client
 
-from app.core.database import get_db, get_service_db
+from app.core.database import get_db, get_service_db, now_iso, run_query
 from app.core.auth import require_admin
 from app.core.config import settings
 from app.models.schemas import SectionCreate, SectionUpdate, SectionResponse
@@ -37,7 +37,7 @@ def convert_section_from_db(row: dict) -> dict:
 @router.get("/", response_model=List[SectionResponse])
 async def list_sections(db: Client = Depends(get_db)) -> List[SectionResponse]:
     try:
-        response = db.table(settings.SECTIONS_TABLE).select("*").order("key").execute()
+        response = await run_query(db.table(settings.SECTIONS_TABLE).select("*").order("key"))
         return [convert_section_from_db(row) for row in (response.data or [])]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sections: {str(e)}")
@@ -50,20 +50,18 @@ async def create_section(
     db: Client = Depends(get_service_db),
 ) -> SectionResponse:
     try:
-        existing = db.table(settings.SECTIONS_TABLE).select("id").eq("key", section.key).execute()
+        existing = await run_query(db.table(settings.SECTIONS_TABLE).select("id").eq("key", section.key))
         if existing.data:
             raise HTTPException(status_code=400, detail="Section key already exists")
 
-        now = datetime.utcnow().isoformat()
+        # created_at/updated_at are left to their column defaults (one database clock)
         payload = {
             "key": section.key,
             "name": section.name,
-            "created_at": now,
-            "updated_at": now,
             "created_by": current_user.get("id"),
             "updated_by": current_user.get("id"),
         }
-        response = db.table(settings.SECTIONS_TABLE).insert(payload).execute()
+        response = await run_query(db.table(settings.SECTIONS_TABLE).insert(payload))
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to create section")
         return convert_section_from_db(response.data[0])
@@ -81,7 +79,7 @@ async def update_section(
     db: Client = Depends(get_service_db),
 ) -> SectionResponse:
     try:
-        existing = db.table(settings.SECTIONS_TABLE).select("*").eq("key", section_key).execute()
+        existing = await run_query(db.table(settings.SECTIONS_TABLE).select("*").eq("key", section_key))
         if not existing.data:
             raise HTTPException(status_code=404, detail="Section not found")
 
@@ -92,10 +90,10 @@ async def update_section(
         if not update_data:
             return convert_section_from_db(existing.data[0])
 
-        update_data["updated_at"] = datetime.utcnow().isoformat()
+        update_data["updated_at"] = now_iso()
         update_data["updated_by"] = current_user.get("id")
 
-        response = db.table(settings.SECTIONS_TABLE).update(update_data).eq("key", section_key).execute()
+        response = await run_query(db.table(settings.SECTIONS_TABLE).update(update_data).eq("key", section_key))
         if not response.data:
             raise HTTPException(status_code=500, detail="Failed to update section")
         return convert_section_from_db(response.data[0])
@@ -117,11 +115,14 @@ async def delete_section(
     Only allowed if there are zero policies currently assigned to that section key.
     """
     try:
-        existing = db.table(settings.SECTIONS_TABLE).select("id").eq("key", section_key).execute()
+        # The existence check and the policy lookup are independent - run them concurrently
+        existing, policies = await asyncio.gather(
+            run_query(db.table(settings.SECTIONS_TABLE).select("id").eq("key", section_key)),
+            run_query(db.table(settings.POLICIES_TABLE).select("id").eq("section", section_key)),
+        )
         if not existing.data:
             raise HTTPException(status_code=404, detail="Section not found")
 
-        policies = db.table(settings.POLICIES_TABLE).select("id").eq("section", section_key).execute()
         policy_count = len(policies.data or [])
         if policy_count > 0:
             raise HTTPException(
@@ -129,7 +130,7 @@ async def delete_section(
                 detail=f"Cannot delete section '{section_key}' because it has {policy_count} policy/policies"
             )
 
-        db.table(settings.SECTIONS_TABLE).delete().eq("key", section_key).execute()
+        await run_query(db.table(settings.SECTIONS_TABLE).delete().eq("key", section_key))
         return None
     except HTTPException:
         raise
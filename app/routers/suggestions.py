@@ -7,9 +7,10 @@
  *
  * Public Functions:
  *    convert_suggestion_from_db(row: dict) --> dict
- *        Converts a database row to suggestion response format
- *    get_suggestions(status: Optional[SuggestionStatus], policy_id: Optional[str],
- *      bylaw_id: Optional[str], limit: int, offset: int, current_user: dict, db: Client) --> List[SuggestionResponse]
+ *        Converts a database row (with embedded policy/bylaw) to suggestion response format
+ *    get_suggestions(request: Request, status: Optional[SuggestionStatus], policy_id: Optional[str],
+ *      bylaw_id: Optional[str], limit: int, offset: int, before: Optional[datetime],
+ *      before_id: Optional[UUID], current_user: dict, db: Client) --> List[SuggestionResponse]
  *        Gets all suggestions with optional filtering (admin or policy working group)
  *    create_suggestion(suggestion: SuggestionCreate, db: Client) --> SuggestionResponse
  *        Creates a new suggestion (public access)
@@ -20,146 +21,194 @@
  * @date: January 2026
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List, Optional
-from app.core.database import get_db, get_service_db
+import orjson
+from operator import itemgetter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Final, List, Optional, Tuple
+from app.core.http_cache import etag_response, make_etag
+from app.core.database import get_db, get_service_db, returning, run_query, quote_filter_value
 from app.core.auth import require_admin, require_suggestion_manager, get_optional_user
 from app.models.schemas import (
     SuggestionCreate, SuggestionUpdate, SuggestionResponse, SuggestionStatus
 )
 from app.core.config import settings
+from postgrest.exceptions import APIError
 from supabase import Client
 from datetime import datetime
+from uuid import UUID
 
 router = APIRouter()
 
+# Postgres SQLSTATE for a missing policy (raised by the create_suggestion RPC)
+# or bylaw (raised by the bylaw_id foreign key)
+FOREIGN_KEY_VIOLATION: Final[str] = "23503"
 
-def convert_suggestion_from_db(row: dict, policy_info: Optional[dict] = None, bylaw_info: Optional[dict] = None) -> dict:
+# How long a browser may reuse a suggestion list before revalidating it (seconds)
+SUGGESTIONS_MAX_AGE: Final[int] = 5
+
+# Columns of a suggestions row read by convert_suggestion_from_db
+SUGGESTION_COLS: Final[str] = "id,policy_id,bylaw_id,suggestion,status,created_at,updated_at"
+
+# Pulls SUGGESTION_COLS out of a row in a single call
+_suggestion_fields = itemgetter(*SUGGESTION_COLS.split(","))
+
+# Display fields of a suggestion with no embedded policy/bylaw
+_NO_PARENT: Final[Tuple[None, None]] = (None, None)
+
+# Suggestions with their policy and bylaw embedded by PostgREST through the
+# policy_id/bylaw_id foreign keys, so a list is one round trip
+BYLAW_EMBED: Final[str] = f"{settings.BYLAWS_TABLE}!bylaw_id(number,title)"
+SUGGESTION_SELECT: Final[str] = (
+    f"{SUGGESTION_COLS},{settings.POLICIES_TABLE}!policy_id(policy_id,name),{BYLAW_EMBED}"
+)
+# Inner join on the policy, so suggestions can be filtered by its TEXT policy_id
+SUGGESTION_SELECT_BY_POLICY: Final[str] = (
+    f"{SUGGESTION_COLS},{settings.POLICIES_TABLE}!policy_id!inner(policy_id,name),{BYLAW_EMBED}"
+)
+
+
+def convert_suggestion_from_db(row: dict) -> dict:
     """
     Convert database row to suggestion response format
     
     Args:
-        row: Dictionary containing suggestion data from database
-        policy_info: Optional dictionary with policy information {policy_id, policy_name}
-        bylaw_info: Optional dictionary with bylaw information {bylaw_number, bylaw_title}
+        row: Dictionary containing suggestion data from database, optionally
+            with the embedded policy {policy_id, name} and bylaw {number, title}
     """
-    result = {
-        "id": str(row.get("id")),
-        "policy_id": row.get("policy_id"),
-        "bylaw_id": row.get("bylaw_id"),
-        "suggestion": row.get("suggestion", ""),
-        "status": row.get("status", "pending"),
-        "created_at": row.get("created_at"),
-        "updated_at": row.get("updated_at"),
-        "policy_id_text": None,
-        "policy_name": None,
-        "bylaw_number": None,
-        "bylaw_title": None
-    }
-    
-    # Add policy information if available
-    if policy_info:
-        result["policy_id_text"] = policy_info.get("policy_id")
-        result["policy_name"] = policy_info.get("policy_name")
-    
-    # Add bylaw information if available
-    if bylaw_info:
-        result["bylaw_number"] = bylaw_info.get("bylaw_number")
-        result["bylaw_title"] = bylaw_info.get("bylaw_title")
+    # Every query returns all SUGGESTION_COLS (suggestion is NOT NULL); the
+    # embeds are absent on rows from create_suggestion and null with no parent
+    (suggestion_uuid, policy_uuid, bylaw_uuid, suggestion, status,
+     created_at, updated_at) = _suggestion_fields(row)
+    policy_info: Optional[dict] = row.get(settings.POLICIES_TABLE)
+    bylaw_info: Optional[dict] = row.get(settings.BYLAWS_TABLE)
+    policy_id_text, policy_name = (policy_info["policy_id"], policy_info["name"]) if policy_info else _NO_PARENT
+    bylaw_number, bylaw_title = (bylaw_info["number"], bylaw_info["title"]) if bylaw_info else _NO_PARENT
     
-    return result
+    return {
+        "id": suggestion_uuid,  # Already a string in PostgREST's JSON
+        "policy_id": policy_uuid,
+        "bylaw_id": bylaw_uuid,
+        "suggestion": suggestion,
+        "status": status or "pending",
+        "created_at": created_at,
+        "updated_at": updated_at,
+        # Policy/bylaw information, if available
+        "policy_id_text": policy_id_text,
+        "policy_name": policy_name,
+        "bylaw_number": bylaw_number,
+        "bylaw_title": bylaw_title
+    }
+
+
+def _etag_response(request: Request, payload: list, headers: dict) -> Response:
+    """
+    Serialize a suggestion list with an ETag, or 304 Not Modified if the client already has it
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        payload: List of suggestion dicts
+        headers: Extra response headers (e.g. the next-page cursor)
+
+    Returns:
+        Response: 200 with the body, or 304 with no body
+    """
+    body: bytes = orjson.dumps(payload)
+    return etag_response(request, body, make_etag(body), f"private, max-age={SUGGESTIONS_MAX_AGE}", headers)
 
 
 @router.get("/", response_model=List[SuggestionResponse])
 async def get_suggestions(
+    request: Request,
     status: Optional[SuggestionStatus] = Query(None, description="Filter by status"),
     policy_id: Optional[str] = Query(None, description="Filter by policy_id (TEXT like '1.1.1')"),
     bylaw_id: Optional[str] = Query(None, description="Filter by bylaw ID (UUID)"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    before: Optional[datetime] = Query(None, description="Return suggestions created before this time (keyset cursor)"),
+    before_id: Optional[UUID] = Query(None, description="Break created_at ties at the cursor (from X-Next-Before-Id)"),
     current_user: dict = Depends(require_suggestion_manager),  # Admin or policy working group
     db: Client = Depends(get_service_db)
 ):
     """
     Get all suggestions (admin or policy working group)
     
+    Responses carry an ETag, and a matching If-None-Match gets 304 Not
+    Modified, so polling admin pages skip re-downloading unchanged lists.
+    
+    Deep pages should use the keyset cursor instead of a large offset: a full
+    page sets the X-Next-Before and X-Next-Before-Id headers to the before and
+    before_id values for the next page. The cursor replaces offset, so a
+    non-zero offset together with before is rejected.
+    
     Args:
+        request: Incoming request (read for If-None-Match)
         status: Optional status filter
-        policy_id: Policy identifier (TEXT like "1.1.1") - will be converted to UUID
+        policy_id: Policy identifier (TEXT like "1.1.1") - matched on the embedded policy
         bylaw_id: Bylaw UUID
         limit: Maximum number of results
         offset: Pagination offset
+        before: Only return suggestions created before this time
+        before_id: With before, also return suggestions created at exactly
+            that time whose id sorts below this one
         current_user: Current authenticated user
         db: Supabase database client
         
     Returns:
         List[SuggestionResponse]: List of suggestions
-    """
-    try:
-        query = db.table(settings.SUGGESTIONS_TABLE).select("*")
-        
-        # Apply filters
-        if status:
-            query = query.eq("status", status.value)
-        if policy_id:
-            # Convert policy_id (TEXT) to UUID for filtering
-            policy_check = db.table(settings.POLICIES_TABLE).select("id").eq("policy_id", policy_id).execute()
-            if policy_check.data:
-                policy_uuid = policy_check.data[0].get("id")
-                query = query.eq("policy_id", policy_uuid)
-            else:
-                # Policy not found, return empty list
-                return []
-        if bylaw_id:
-            query = query.eq("bylaw_id", bylaw_id)
-        
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
-        
-        # Order by creation date (newest first)
-        query = query.order("created_at", desc=True)
         
-        response = query.execute()
-        
-        # Collect all unique policy and bylaw UUIDs from suggestions
-        policy_uuids = set()
-        bylaw_uuids = set()
-        for row in response.data:
-            if row.get("policy_id"):
-                policy_uuids.add(row.get("policy_id"))
-            if row.get("bylaw_id"):
-                bylaw_uuids.add(row.get("bylaw_id"))
-        
-        # Fetch policy information for all policy UUIDs
-        policy_map = {}
-        if policy_uuids:
-            policies_response = db.table(settings.POLICIES_TABLE).select("id, policy_id, name").in_("id", list(policy_uuids)).execute()
-            for policy in policies_response.data:
-                policy_map[policy.get("id")] = {
-                    "policy_id": policy.get("policy_id"),
-                    "policy_name": policy.get("name")
-                }
-        
-        # Fetch bylaw information for all bylaw UUIDs
-        bylaw_map = {}
-        if bylaw_uuids:
-            bylaws_response = db.table(settings.BYLAWS_TABLE).select("id, number, title").in_("id", list(bylaw_uuids)).execute()
-            for bylaw in bylaws_response.data:
-                bylaw_map[bylaw.get("id")] = {
-                    "bylaw_number": bylaw.get("number"),
-                    "bylaw_title": bylaw.get("title")
-                }
-        
-        # Convert suggestions with policy/bylaw information
-        suggestions = []
-        for row in response.data:
-            policy_info = policy_map.get(row.get("policy_id")) if row.get("policy_id") else None
-            bylaw_info = bylaw_map.get(row.get("bylaw_id")) if row.get("bylaw_id") else None
-            suggestions.append(convert_suggestion_from_db(row, policy_info, bylaw_info))
-        
-        return suggestions
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching suggestions: {str(e)}")
+    Raises:
+        HTTPException: If offset is combined with before, or before_id is
+            given without before
+    """
+    if before_id and not before:
+        raise HTTPException(status_code=400, detail="before_id requires before")
+    if before and offset:
+        raise HTTPException(status_code=400, detail="Use either before or offset, not both")
+    
+    # Policy and bylaw details come back embedded in each row (one round trip)
+    if policy_id:
+        # Filter on the embedded policy's TEXT policy_id; the inner join drops
+        # suggestions for other policies (and returns none if it does not exist).
+        # The TEXT -> UUID resolution happens inside this query, so there is
+        # no lookup worth caching in-process (same for create_suggestion's RPC)
+        query = db.table(settings.SUGGESTIONS_TABLE).select(SUGGESTION_SELECT_BY_POLICY)
+        query = query.eq(f"{settings.POLICIES_TABLE}.policy_id", policy_id)
+    else:
+        query = db.table(settings.SUGGESTIONS_TABLE).select(SUGGESTION_SELECT)
+    
+    # Apply filters
+    if status:
+        query = query.eq("status", status.value)
+    if bylaw_id:
+        query = query.eq("bylaw_id", bylaw_id)
+    if before_id:
+        # Keyset pagination on (created_at, id) - the index range scan starts
+        # at the cursor instead of reading and discarding `offset` rows, and
+        # rows sharing the cursor's timestamp are not skipped
+        created_at = quote_filter_value(before.isoformat())
+        query = query.or_(
+            f"created_at.lt.{created_at},"
+            f"and(created_at.eq.{created_at},id.lt.{before_id})"
+        )
+    elif before:
+        query = query.lt("created_at", before.isoformat())
+    
+    # Apply pagination
+    query = query.range(offset, offset + limit - 1)
+    
+    # Order by creation date (newest first), id breaking ties for the cursor
+    query = query.order("created_at", desc=True).order("id", desc=True)
+    
+    response = await run_query(query)
+    headers: dict = {}
+    if len(response.data) == limit:
+        headers["X-Next-Before"] = response.data[-1]["created_at"]
+        headers["X-Next-Before-Id"] = response.data[-1]["id"]
+    
+    # Convert suggestions with their embedded policy/bylaw information. The
+    # ETag hashes the serialized list, so a changed policy/bylaw name changes it too
+    return _etag_response(request, [convert_suggestion_from_db(row) for row in response.data], headers)
 
 
 @router.post("/", response_model=SuggestionResponse, status_code=201)
@@ -168,53 +217,37 @@ async def create_suggestion(
     db: Client = Depends(get_db)  # Public can create suggestions
 ):
     """Create a new suggestion (public access)"""
+    # Validate that either policy_id or bylaw_id is provided
+    if not suggestion.policy_id and not suggestion.bylaw_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Either policy_id or bylaw_id must be provided"
+        )
+    
+    # One RPC converts policy_id (TEXT like "1.1.1") to the policy's UUID and
+    # inserts; timestamps use column defaults
     try:
-        # Validate that either policy_id or bylaw_id is provided
-        if not suggestion.policy_id and not suggestion.bylaw_id:
+        response = await run_query(db.rpc("create_suggestion", {
+            "p_policy_id": suggestion.policy_id,
+            "p_bylaw_id": suggestion.bylaw_id,
+            "p_suggestion": suggestion.suggestion,
+            "p_status": suggestion.status.value
+        }))
+    except APIError as e:
+        if e.code == FOREIGN_KEY_VIOLATION:
+            # The RPC raises "Policy not found" itself; a bylaw_id with no bylaw
+            # is rejected by the suggestions_bylaw_id_fkey constraint
             raise HTTPException(
-                status_code=400,
-                detail="Either policy_id or bylaw_id must be provided"
+                status_code=404,
+                detail="Bylaw not found" if "bylaw_id" in (e.message or "") else "Policy not found"
             )
-        
-        # Convert policy_id (TEXT) or bylaw_id to UUID for foreign key relationships
-        policy_uuid = None
-        bylaw_uuid = None
-        
-        # If policy_id is provided (TEXT like "1.1.1"), look up the UUID
-        if suggestion.policy_id:
-            policy_check = db.table(settings.POLICIES_TABLE).select("id").eq("policy_id", suggestion.policy_id).execute()
-            if not policy_check.data:
-                raise HTTPException(status_code=404, detail="Policy not found")
-            policy_uuid = policy_check.data[0].get("id")  # Get UUID for foreign key
-        
-        # If bylaw_id is provided, verify it exists and get UUID
-        # Note: bylaw_id in suggestions might be UUID or bylaw number - need to check schema
-        # For now, assuming it's UUID (bylaws don't have a TEXT identifier like policies)
-        if suggestion.bylaw_id:
-            bylaw_check = db.table(settings.BYLAWS_TABLE).select("id").eq("id", suggestion.bylaw_id).execute()
-            if not bylaw_check.data:
-                raise HTTPException(status_code=404, detail="Bylaw not found")
-            bylaw_uuid = bylaw_check.data[0].get("id")  # Get UUID for foreign key
-        
-        suggestion_data = {
-            "policy_id": policy_uuid,  # Use UUID for foreign key
-            "bylaw_id": bylaw_uuid,  # Use UUID for foreign key
-            "suggestion": suggestion.suggestion,
-            "status": suggestion.status.value,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat()
-        }
-        
-        response = db.table(settings.SUGGESTIONS_TABLE).insert(suggestion_data).execute()
-        
-        if not response.data:
-            raise HTTPException(status_code=500, detail="Failed to create suggestion")
-        
-        return convert_suggestion_from_db(response.data[0])
-    except HTTPException:
         raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating suggestion: {str(e)}")
+    
+    if not response.data:
+        raise HTTPException(status_code=500, detail="Failed to create suggestion")
+    
+    # Built from the inserted row - skip re-validation against response_model
+    return ORJSONResponse(convert_suggestion_from_db(response.data[0]), status_code=201)
 
 
 @router.delete("/{suggestion_id}", status_code=204)
@@ -224,17 +257,10 @@ async def delete_suggestion(
     db: Client = Depends(get_service_db)
 ):
     """Delete a suggestion (admin or policy working group)"""
-    try:
-        # Check if suggestion exists
-        existing = db.table(settings.SUGGESTIONS_TABLE).select("*").eq("id", suggestion_id).execute()
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Suggestion not found")
-        
-        # Delete suggestion
-        db.table(settings.SUGGESTIONS_TABLE).delete().eq("id", suggestion_id).execute()
-        
-        return None
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error deleting suggestion: {str(e)}")
+    # Delete suggestion - no row back means it did not exist. Only the id is
+    # returned, not the whole suggestion body
+    response = await run_query(returning(db.table(settings.SUGGESTIONS_TABLE).delete().eq("id", suggestion_id), "id"))
+    if not response.data:
+        raise HTTPException(status_code=404, detail="Suggestion not found")
+    
+    return None
@@ -7,6 +7,9 @@
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Enable trigram matching (indexes substring ILIKE searches)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Policies Table
 -- Note: Database columns use 'name' and 'content', but API uses 'policy_name' and 'policy_content'
 -- The API automatically maps between these names
@@ -36,8 +39,11 @@ CREATE TABLE IF NOT EXISTS bylaws (
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW(),
     created_by TEXT,
-    updated_by TEXT
+    updated_by TEXT,
+    -- number as text, so searches can match it as a substring ("1" finds 1, 10, 21)
+    number_text TEXT GENERATED ALWAYS AS (number::TEXT) STORED
 );
+ALTER TABLE bylaws ADD COLUMN IF NOT EXISTS number_text TEXT GENERATED ALWAYS AS (number::TEXT) STORED;
 
 -- Suggestions Table
 CREATE TABLE IF NOT EXISTS suggestions (
@@ -125,19 +131,56 @@ END $$;
 -- Indexes for Policies
 CREATE INDEX IF NOT EXISTS idx_policies_status ON policies(status);
 CREATE INDEX IF NOT EXISTS idx_policies_section ON policies(section);
-CREATE INDEX IF NOT EXISTS idx_policies_policy_id ON policies(policy_id);
 CREATE INDEX IF NOT EXISTS idx_policies_created_at ON policies(created_at);
+-- Status + section filters with the (section, policy_id) ordering of the list
+-- endpoints (approved list, admin list by status) in one index
+CREATE INDEX IF NOT EXISTS idx_policies_status_section_policy_id ON policies(status, section, policy_id);
+-- policy_id lookups use the index behind its UNIQUE constraint; this one duplicated it
+DROP INDEX IF EXISTS idx_policies_policy_id;
+-- Full-text index backing search_policies(); the expression must match the one
+-- in that function exactly for the planner to use it. to_tsvector already
+-- case-folds every lexeme, so policies need no lowercase shadow columns
+CREATE INDEX IF NOT EXISTS idx_policies_search_tsv ON policies USING GIN (
+    to_tsvector('english', coalesce(name, '') || ' ' || coalesce(policy_id, '') || ' ' || coalesce(content, ''))
+);
+-- Trigram index backs search_policies()' policy_id prefix match (ILIKE '1.2%')
+CREATE INDEX IF NOT EXISTS idx_policies_policy_id_trgm ON policies USING GIN (policy_id gin_trgm_ops);
+-- Superseded by idx_policies_search_tsv
+DROP INDEX IF EXISTS idx_policies_name_trgm;
+DROP INDEX IF EXISTS idx_policies_content_trgm;
 
 -- Indexes for Bylaws
-CREATE INDEX IF NOT EXISTS idx_bylaws_status ON bylaws(status);
-CREATE INDEX IF NOT EXISTS idx_bylaws_number ON bylaws(number);
 CREATE INDEX IF NOT EXISTS idx_bylaws_created_at ON bylaws(created_at);
+-- Status filter + number ordering (approved list, admin list by status) in one
+-- index; unfiltered number ordering and lookups use the UNIQUE(number) index
+CREATE INDEX IF NOT EXISTS idx_bylaws_status_number ON bylaws(status, number);
+-- Superseded by idx_bylaws_status_number (status is its leading column) and
+-- the UNIQUE(number) constraint's index
+DROP INDEX IF EXISTS idx_bylaws_status;
+DROP INDEX IF EXISTS idx_bylaws_number;
+DROP INDEX IF EXISTS idx_bylaws_approved_number;
+-- Trigram indexes back the ILIKE '%term%' bylaw search. pg_trgm lowercases
+-- trigrams itself, so no lower(title)/lower(content) shadow columns are needed
+CREATE INDEX IF NOT EXISTS idx_bylaws_title_trgm ON bylaws USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_bylaws_content_trgm ON bylaws USING GIN (content gin_trgm_ops);
 
 -- Indexes for Suggestions
-CREATE INDEX IF NOT EXISTS idx_suggestions_status ON suggestions(status);
-CREATE INDEX IF NOT EXISTS idx_suggestions_policy_id ON suggestions(policy_id);
-CREATE INDEX IF NOT EXISTS idx_suggestions_bylaw_id ON suggestions(bylaw_id);
-CREATE INDEX IF NOT EXISTS idx_suggestions_created_at ON suggestions(created_at);
+-- Each list filter + newest-first order in one index, so a page is an index
+-- range scan instead of a sort. The trailing id breaks created_at ties for the
+-- (created_at, id) keyset cursor. The leading policy_id/bylaw_id columns also
+-- serve the foreign keys' ON DELETE SET NULL lookups
+CREATE INDEX IF NOT EXISTS idx_suggestions_created_at_id ON suggestions(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_suggestions_status_created_at_id ON suggestions(status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_suggestions_policy_id_created_at_id ON suggestions(policy_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_suggestions_bylaw_id_created_at_id ON suggestions(bylaw_id, created_at DESC, id DESC);
+-- Superseded by the composite indexes above
+DROP INDEX IF EXISTS idx_suggestions_created_at;
+DROP INDEX IF EXISTS idx_suggestions_status_created_at;
+DROP INDEX IF EXISTS idx_suggestions_policy_id_created_at;
+DROP INDEX IF EXISTS idx_suggestions_bylaw_id_created_at;
+DROP INDEX IF EXISTS idx_suggestions_status;
+DROP INDEX IF EXISTS idx_suggestions_policy_id;
+DROP INDEX IF EXISTS idx_suggestions_bylaw_id;
 
 -- Indexes for Users
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
@@ -190,6 +233,316 @@ BEGIN
     END IF;
 END $$;
 
+-- Mirror new Supabase Auth users into the users table.
+-- The role is read from app_metadata, which only the service role can set
+-- (user_metadata is writable by the user, so it is never trusted for roles);
+-- anything missing or unknown becomes 'public'. An existing row with the same
+-- email is re-keyed to the new auth ID and keeps its role unless one was given.
+CREATE OR REPLACE FUNCTION public.sync_user_to_users_table()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    new_role TEXT := NEW.raw_app_meta_data->>'role';
+BEGIN
+    IF new_role IS NOT NULL AND new_role NOT IN ('public', 'admin', 'policy_working_group') THEN
+        new_role := NULL;
+    END IF;
+
+    INSERT INTO public.users (id, email, name, role)
+    VALUES (NEW.id, NEW.email, NEW.raw_user_meta_data->>'name', COALESCE(new_role, 'public'))
+    ON CONFLICT (email) DO UPDATE
+        SET id = EXCLUDED.id,
+            name = COALESCE(EXCLUDED.name, public.users.name),
+            role = CASE WHEN new_role IS NULL THEN public.users.role ELSE EXCLUDED.role END;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS on_auth_user_created ON auth.users;
+CREATE TRIGGER on_auth_user_created
+    AFTER INSERT ON auth.users
+    FOR EACH ROW EXECUTE FUNCTION public.sync_user_to_users_table();
+
+-- RPC Functions
+-- Returns the calling auth user joined with their role from the users table.
+-- Called with the user's access token, so PostgREST verifies the JWT and
+-- auth.uid() resolves to the caller - token check and role lookup in one request.
+-- has_profile is false when the auth user has no row in the users table yet.
+CREATE OR REPLACE FUNCTION public.get_user_with_role()
+RETURNS TABLE (id UUID, email TEXT, role TEXT, user_metadata JSONB, has_profile BOOLEAN)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT au.id, au.email::TEXT, COALESCE(u.role, 'public'), au.raw_user_meta_data, u.id IS NOT NULL
+    FROM auth.users au
+    LEFT JOIN public.users u ON u.id = au.id
+    WHERE au.id = auth.uid();
+$$;
+
+-- Deletes a users row and returns its email as a one-row table (no rows if
+-- there was no such user - PostgREST clients expect a list, not a scalar), so
+-- the delete-user endpoint needs one request instead of select + delete.
+-- Only the users row is deleted; the endpoint removes the Auth account after.
+-- Only the service role may call it.
+DROP FUNCTION IF EXISTS public.delete_user_cascade(UUID);
+DROP FUNCTION IF EXISTS public.delete_user_row(UUID);  -- return type changed from TEXT
+CREATE FUNCTION public.delete_user_row(uid UUID)
+RETURNS TABLE (email TEXT)
+LANGUAGE sql
+VOLATILE
+SET search_path = public
+AS $$
+    DELETE FROM public.users u WHERE u.id = uid RETURNING u.email;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.delete_user_row(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.delete_user_row(UUID) TO service_role;
+
+-- Signs a user out of every session by deleting their Auth sessions (which
+-- revokes their refresh tokens) and returns how many were deleted, as a
+-- one-row table (PostgREST clients expect a list, not a void/null body).
+-- Used after a role change; only the service role may call it.
+DROP FUNCTION IF EXISTS public.revoke_user_sessions(UUID);  -- return type changed from VOID
+CREATE FUNCTION public.revoke_user_sessions(uid UUID)
+RETURNS TABLE (revoked_count INTEGER)
+LANGUAGE sql
+VOLATILE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH revoked AS (DELETE FROM auth.sessions WHERE user_id = uid RETURNING 1)
+    SELECT count(*)::INTEGER FROM revoked;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.revoke_user_sessions(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.revoke_user_sessions(UUID) TO service_role;
+
+-- Admin bylaw list: status filter, search, ordering, pagination and the total
+-- match count in one planned statement. Search matches title, content and
+-- number as a literal case-insensitive substring, like the PostgREST filter
+-- used by the public endpoints. Runs as the caller, so RLS still applies.
+-- total_count is the number of matches across all pages (repeated on each row).
+CREATE OR REPLACE FUNCTION public.get_bylaws(p_status TEXT, p_search TEXT, p_limit INT, p_offset INT)
+RETURNS TABLE (
+    id UUID, number INTEGER, title TEXT, content TEXT, status TEXT,
+    created_at TIMESTAMPTZ, updated_at TIMESTAMPTZ, created_by TEXT, updated_by TEXT,
+    total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    WITH params AS (
+        SELECT
+            '%' || replace(replace(replace(p_search, '\', '\\'), '%', '\%'), '_', '\_') || '%' AS pattern
+    )
+    SELECT b.id, b.number, b.title, b.content, b.status,
+           b.created_at, b.updated_at, b.created_by, b.updated_by,
+           count(*) OVER () AS total_count
+    FROM bylaws b, params
+    WHERE (p_status IS NULL OR b.status = p_status)
+      AND (p_search IS NULL
+           OR b.title ILIKE params.pattern
+           OR b.content ILIKE params.pattern
+           OR b.number_text ILIKE params.pattern)
+    ORDER BY b.number
+    LIMIT p_limit OFFSET p_offset;
+$$;
+
+-- Policy search: full-text match of q against name, policy_id and content
+-- (stemmed English words, all of which must appear), or q as a literal
+-- policy_id prefix, plus the list endpoints' filters, ordering and pagination.
+-- Runs as the caller, so RLS still applies. p_limit NULL returns every match.
+-- total_count is the number of matches across all pages (repeated on each row).
+DROP FUNCTION IF EXISTS public.search_policies(TEXT, TEXT, TEXT, TEXT, INT, INT);
+CREATE OR REPLACE FUNCTION public.search_policies(
+    q TEXT,
+    p_status TEXT DEFAULT NULL,
+    p_section TEXT DEFAULT NULL,
+    p_policy_id TEXT DEFAULT NULL,
+    p_limit INT DEFAULT NULL,
+    p_offset INT DEFAULT 0
+)
+RETURNS TABLE (
+    id UUID, policy_id TEXT, name TEXT, section TEXT, content TEXT, status TEXT,
+    created_at TIMESTAMPTZ, updated_at TIMESTAMPTZ, created_by TEXT, updated_by TEXT,
+    total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT p.id, p.policy_id, p.name, p.section, p.content, p.status,
+           p.created_at, p.updated_at, p.created_by, p.updated_by,
+           count(*) OVER () AS total_count
+    FROM policies p
+    WHERE (to_tsvector('english', coalesce(p.name, '') || ' ' || coalesce(p.policy_id, '') || ' ' || coalesce(p.content, ''))
+               @@ plainto_tsquery('english', q)
+           OR p.policy_id ILIKE replace(replace(replace(q, '\', '\\'), '%', '\%'), '_', '\_') || '%')
+      AND (p_status IS NULL OR p.status = p_status)
+      AND (p_section IS NULL OR p.section = p_section)
+      AND (p_policy_id IS NULL OR p.policy_id = p_policy_id)
+    ORDER BY p.section, p.policy_id
+    LIMIT p_limit OFFSET p_offset;
+$$;
+
+-- Updates a policy and records its version history in one statement: locks
+-- the row, saves the pre-update state as the next policy_versions entry when
+-- anything changes (including an approved policy going back to draft), then
+-- applies the update. NULL arguments leave a field unchanged. Returns the
+-- updated row, or no rows if the policy does not exist. Service role only.
+CREATE OR REPLACE FUNCTION public.update_policy_with_version(
+    p_policy_id TEXT,
+    p_name TEXT,
+    p_section TEXT,
+    p_content TEXT,
+    p_user TEXT
+)
+RETURNS SETOF policies
+LANGUAGE sql
+VOLATILE
+SET search_path = public
+AS $$
+    -- FOR UPDATE serializes concurrent updates, so version numbers cannot collide
+    WITH existing AS (
+        SELECT * FROM policies WHERE policy_id = p_policy_id FOR UPDATE
+    ),
+    -- Zero or one version row: the WHERE clause is the change check
+    versioned AS (
+        INSERT INTO policy_versions (policy_id, version_number, name, section, content, status, created_at, created_by)
+        SELECT e.id,
+               (SELECT COALESCE(MAX(v.version_number), 0) + 1 FROM policy_versions v WHERE v.policy_id = e.id),
+               e.name, e.section, COALESCE(e.content, ''), COALESCE(e.status, 'draft'), NOW(), p_user
+        FROM existing e
+        WHERE (p_name IS NOT NULL AND p_name IS DISTINCT FROM e.name)
+           OR (p_section IS NOT NULL AND p_section IS DISTINCT FROM e.section)
+           OR (p_content IS NOT NULL AND p_content IS DISTINCT FROM e.content)
+           OR e.status IS DISTINCT FROM 'draft'
+    )
+    UPDATE policies p
+    SET name = COALESCE(p_name, e.name),
+        section = COALESCE(p_section, e.section),
+        content = COALESCE(p_content, e.content),
+        status = 'draft',
+        updated_at = NOW(),
+        updated_by = p_user
+    FROM existing e
+    WHERE p.id = e.id
+    RETURNING p.*;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.update_policy_with_version(TEXT, TEXT, TEXT, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.update_policy_with_version(TEXT, TEXT, TEXT, TEXT, TEXT) TO service_role;
+
+-- Deletes every policy review in one statement and returns how many were
+-- deleted, as a one-row table (PostgREST clients expect a list, not a
+-- scalar). Service role only.
+DROP FUNCTION IF EXISTS public.reset_all_policy_reviews();  -- return type changed from INTEGER
+CREATE FUNCTION public.reset_all_policy_reviews()
+RETURNS TABLE (deleted_count INTEGER)
+LANGUAGE sql
+VOLATILE
+SET search_path = public
+AS $$
+    WITH deleted AS (DELETE FROM policy_reviews RETURNING 1)
+    SELECT count(*)::INTEGER FROM deleted;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.reset_all_policy_reviews() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.reset_all_policy_reviews() TO service_role;
+
+-- Review summary for one policy: whether the policy exists, and the reviewer
+-- emails grouped by review status. Always returns exactly one row. Runs as the
+-- caller, so RLS on policies and policy_reviews still applies.
+CREATE OR REPLACE FUNCTION public.policy_reviews_summary(p TEXT)
+RETURNS TABLE (policy_exists BOOLEAN, confirmed TEXT[], needs_work TEXT[])
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT
+        EXISTS (SELECT 1 FROM policies WHERE policy_id = p),
+        COALESCE(array_agg(r.user_email) FILTER (WHERE r.review_status = 'confirm'), '{}'),
+        COALESCE(array_agg(r.user_email) FILTER (WHERE r.review_status = 'needs_work'), '{}')
+    FROM policy_reviews r
+    WHERE r.policy_id = p;
+$$;
+
+-- Version history page for one policy, looked up by its TEXT policy_id, in a
+-- single request: each row carries the parent's UUID and policy_id alongside
+-- the version, newest first. Returns no rows if the policy does not exist, and
+-- one row with a NULL version_number if it has no versions in range.
+-- Service role only.
+CREATE OR REPLACE FUNCTION public.get_policy_versions(
+    p_policy_id TEXT,
+    p_limit INT DEFAULT NULL,
+    p_before_version INT DEFAULT NULL
+)
+RETURNS TABLE (
+    policy_uuid UUID, policy_identifier TEXT, version_number INTEGER,
+    name TEXT, section TEXT, content TEXT, status TEXT,
+    created_at TIMESTAMPTZ, created_by TEXT
+)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT p.id, p.policy_id, v.version_number, v.name, v.section, v.content, v.status,
+           v.created_at, v.created_by
+    FROM policies p
+    LEFT JOIN LATERAL (
+        SELECT pv.*
+        FROM policy_versions pv
+        WHERE pv.policy_id = p.id
+          AND (p_before_version IS NULL OR pv.version_number < p_before_version)
+        ORDER BY pv.version_number DESC
+        LIMIT p_limit
+    ) v ON true
+    WHERE p.policy_id = p_policy_id
+    ORDER BY v.version_number DESC;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.get_policy_versions(TEXT, INT, INT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_policy_versions(TEXT, INT, INT) TO service_role;
+
+-- Creates a suggestion in a single request: resolves the TEXT policy_id to
+-- the policy's UUID and inserts, in one transaction. A missing policy raises
+-- foreign_key_violation (23503) with a "Policy not found" message; a missing
+-- bylaw is rejected by the bylaw_id foreign key itself (also 23503). Runs as
+-- the caller, so RLS still applies to the policy lookup and insert.
+CREATE OR REPLACE FUNCTION public.create_suggestion(
+    p_policy_id TEXT,
+    p_bylaw_id UUID,
+    p_suggestion TEXT,
+    p_status TEXT DEFAULT 'pending'
+)
+RETURNS SETOF suggestions
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_policy UUID;
+    v_row suggestions;
+BEGIN
+    IF p_policy_id IS NOT NULL THEN
+        SELECT id INTO v_policy FROM policies WHERE policy_id = p_policy_id;
+        IF v_policy IS NULL THEN
+            RAISE EXCEPTION 'Policy not found' USING ERRCODE = 'foreign_key_violation';
+        END IF;
+    END IF;
+
+    INSERT INTO suggestions (policy_id, bylaw_id, suggestion, status)
+    VALUES (v_policy, p_bylaw_id, p_suggestion, p_status)
+    RETURNING * INTO v_row;
+    RETURN NEXT v_row;
+END;
+$$;
+
 -- Row Level Security (RLS) Policies
 -- Enable RLS on tables
 ALTER TABLE policies ENABLE ROW LEVEL SECURITY;
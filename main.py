@@ -6,10 +6,16 @@
  * for the ASA Policy Management System backend.
  *
  * Public Functions:
+ *    startup() --> None
+ *        Builds the database clients, primes the users cache and JWKS, and starts background tasks
+ *    shutdown() --> None
+ *        Cancels background tasks and closes the shared HTTP client
  *    root() --> dict
  *        Returns API welcome message and status
  *    health_check() --> dict
  *        Returns API health status
+ *    postgrest_exception_handler(request: Request, exc: APIError) --> JSONResponse
+ *        Maps database errors not handled by a route to an HTTP status
  *    global_exception_handler(request: Request, exc: Exception) --> JSONResponse
  *        Handles all unhandled exceptions globally
  *
@@ -17,29 +23,44 @@
  * @date: January 2026
 """
 
+import asyncio
+import logging
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from postgrest.exceptions import APIError
+from typing import Dict, Any, Final, Tuple
 
 from app.routers import policies, bylaws, suggestions, auth, sections
+from app.core.auth import load_jwks, load_users_cache, purge_user, refresh_users_cache
 from app.core.config import settings
+from app.core.database import get_db, get_http_client, get_service_db
+from app.core.redis_cache import get_redis, listen_for_invalidations
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="ASA Policy App API",
     description="Backend API for the Augustana Students' Association Policy Management System",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes datetimes natively and much faster
 )
 
 # CORS middleware configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.get_cors_origins(),
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Before-Version", "X-Next-Before", "X-Next-Before-Id"],  # Lets browser clients read pagination headers
 )
 
+# Compress JSON bodies (suggestion, policy and bylaw text compresses several
+# times over); small responses are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(policies.router, prefix="/api/policies", tags=["Policies"])
@@ -48,6 +69,47 @@ app.include_router(suggestions.router, prefix="/api/suggestions", tags=["Suggest
 app.include_router(sections.router, prefix="/api/sections", tags=["Sections"])
 
 
+@app.on_event("startup")
+async def startup() -> None:
+    """
+    Startup hook - Prepares everything the first requests would otherwise wait for
+    
+    Builds both Supabase clients and their pooled PostgREST sessions, loads the
+    users table for role lookups and the project's signing keys for local token
+    verification, then starts the users cache refresh task and (only when
+    REDIS_URL is configured) the listener that purges users changed by other
+    workers. A failed load is not fatal: lookups fall back to the database and
+    token checks to Supabase Auth.
+    """
+    for db in (get_db(), get_service_db()):
+        db.postgrest  # Created lazily on first access
+    
+    service_db = get_service_db()
+    users_loaded, jwks_loaded = await asyncio.gather(
+        asyncio.to_thread(load_users_cache, service_db),
+        load_jwks(),
+        return_exceptions=True
+    )
+    if isinstance(users_loaded, Exception):
+        logger.warning("Could not prime users cache: %s", users_loaded)
+    if isinstance(jwks_loaded, Exception):
+        logger.warning("Could not load JWKS: %s", jwks_loaded)
+    
+    app.state.users_cache_task = asyncio.create_task(refresh_users_cache(service_db))
+    if get_redis() is not None:
+        app.state.invalidation_task = asyncio.create_task(listen_for_invalidations(purge_user))
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Shutdown hook - Cancels background cache tasks and closes the shared HTTP client"""
+    for name in ("users_cache_task", "invalidation_task"):
+        task = getattr(app.state, name, None)
+        if task:
+            task.cancel()
+    await get_http_client().aclose()
+
+
 @app.get("/")
 async def root() -> Dict[str, str]:
     """
@@ -74,6 +136,49 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy"}
 
 
+# Response for database errors no route handled: exact codes first, then by
+# prefix (PostgREST's PGRST1xx request errors, PGRST3xx JWT errors, and Postgres
+# SQLSTATE classes). Fixed details only - the raw message names tables,
+# columns and constraints, so it is logged rather than sent to the client
+DB_ERROR_BY_CODE: Final[Dict[str, Tuple[int, str]]] = {
+    "PGRST116": (404, "Not found"),  # .single() matched no rows
+    "42501": (403, "Not allowed"),  # insufficient privilege / row-level security
+}
+DB_ERROR_BY_PREFIX: Final[Tuple[Tuple[str, Tuple[int, str]], ...]] = (
+    ("PGRST1", (400, "Invalid request")),
+    ("PGRST3", (401, "Could not validate credentials")),
+    ("22", (400, "Invalid input")),
+    ("23", (409, "Conflicts with existing data")),
+)
+DB_ERROR_DEFAULT: Final[Tuple[int, str]] = (500, "Database error")
+
+
+@app.exception_handler(APIError)
+async def postgrest_exception_handler(request: Request, exc: APIError) -> JSONResponse:
+    """
+    Database error handler - Maps PostgREST/Postgres errors that a route did
+    not handle itself to an HTTP status, so routes need no catch-all wrapper
+    
+    The client gets a fixed detail for the error's class (see DB_ERROR_BY_CODE
+    and DB_ERROR_BY_PREFIX); the database's own message is only logged.
+    
+    Args:
+        request: The HTTP request that caused the exception
+        exc: The PostgREST error that was raised
+        
+    Returns:
+        JSONResponse: JSON response with error details
+    """
+    code: str = exc.code or ""
+    status_code, detail = DB_ERROR_BY_CODE.get(code) or next(
+        (error for prefix, error in DB_ERROR_BY_PREFIX if code.startswith(prefix)),
+        DB_ERROR_DEFAULT
+    )
+    log = logger.error if status_code >= 500 else logger.warning
+    log("Database error %s on %s %s: %s", code or "-", request.method, request.url.path, exc.message)
+    return JSONResponse(status_code=status_code, content={"detail": detail})
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """